@@ -41,6 +41,9 @@ from .turtle import *
 from .gameloop import *
 from .pgputils import *
 from .music import *
+from .tilemap import *
+from .fonts import *
+from .inputstate import *
 
 class Sound (pygame.mixer.Sound):
     '''
@@ -57,12 +60,17 @@ class Sound (pygame.mixer.Sound):
 
 
 __all__ = [
+    'Camera',
+    'FontRegistry',
+    'Keyboard',
     'MusicStream',
     'Painter', 
     'Screen', 
     'Sound',
     'Sprite', 
+    'TileMap',
     'Turtle', 
+    'animate_together',
     'from_pygame_coordinates', 
     'get_active_screen', 
     'get_game_loop', 
@@ -70,5 +78,7 @@ __all__ = [
     'music_stream',
     'start_game', 
     'end_game', 
+    'font_registry',
+    'keyboard',
     'to_pygame_coordinates'
 ]
\ No newline at end of file
@@ -0,0 +1,209 @@
+# Copyright 2022 Casey Devet
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+################################################################################
+#                               GLOBAL VARIABLES
+################################################################################
+
+import math
+import pygame
+
+from . import pgputils
+
+################################################################################
+#                              DISPLAY LIST CLASS
+################################################################################
+
+class DisplayList (object):
+    '''
+    A DisplayList records the drawings made on a screen's canvas so that they
+    can be drawn again later at any size.
+
+    Each drawing is stored as a command (e.g. a line through some points or
+    a filled polygon) in the screen's coordinates along with the box around
+    it.  The commands are also sorted into a grid of cells so that only the
+    commands in part of the canvas can be found quickly.
+
+    You will not usually need to use a DisplayList directly.  Set the
+    `retained` property of a Screen to `True` to have it keep one.
+    '''
+
+    # The size of the cells used to find the commands in an area.  Commands
+    # that would be in too many cells are kept in a separate list instead.
+    _cell_size = 256
+    _max_cells = 64
+
+    def __init__ (self):
+        '''
+        Create an empty DisplayList.
+        '''
+
+        # The commands as tuples of (kind, box, data) where the box is a
+        # tuple of (left, bottom, right, top)
+        self._commands = []
+
+        # The indices of the commands in each cell and the large commands
+        self._cells = {}
+        self._large = []
+
+
+    def __len__ (self):
+
+        return len(self._commands)
+
+
+    def clear (self):
+        '''
+        Remove all of the commands.
+        '''
+
+        self._commands = []
+        self._cells = {}
+        self._large = []
+
+
+    def add (self, kind, box, *data):
+        '''
+        Add a command to the end of the list.
+
+        The `box` is a tuple of (left, bottom, right, top) around everything
+        the command draws.
+        '''
+
+        index = len(self._commands)
+        self._commands.append((kind, box, data))
+
+        # Add the command to the cells that it touches
+        cells = self._cells_in(box)
+        if len(cells) > DisplayList._max_cells:
+            self._large.append(index)
+        else:
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(index)
+
+
+    # A hidden method that returns the cells that touch the given box.
+    def _cells_in (self, box):
+        size = DisplayList._cell_size
+        left, bottom, right, top = box
+        columns = range(math.floor(left / size), math.floor(right / size) + 1)
+        rows = range(math.floor(bottom / size), math.floor(top / size) + 1)
+        return [(c, r) for c in columns for r in rows]
+
+
+    def find (self, box=None):
+        '''
+        Get the commands that touch the given box, in the order that they
+        were added.
+
+        If no box is given, all of the commands are returned.
+        '''
+
+        if box is None:
+            return list(self._commands)
+
+        # Find the commands in the cells that touch the box
+        cells = self._cells_in(box)
+        if len(cells) > DisplayList._max_cells:
+            indices = range(len(self._commands))
+        else:
+            indices = set(self._large)
+            for cell in cells:
+                indices.update(self._cells.get(cell, ()))
+            indices = sorted(indices)
+
+        # Only keep the commands whose boxes actually touch
+        left, bottom, right, top = box
+        commands = []
+        for index in indices:
+            command = self._commands[index]
+            c_left, c_bottom, c_right, c_top = command[1]
+            if c_left <= right and c_right >= left and c_bottom <= top and c_top >= bottom:
+                commands.append(command)
+        return commands
+
+
+    def draw (self, surface, corner, scale=1, box=None):
+        '''
+        Draw the commands on a surface.
+
+        The `corner` is the point in the screen's coordinates that will be
+        at the top left corner of the surface and `scale` is the number of
+        pixels for each unit.  If a `box` is given, only the commands that
+        touch it are drawn.
+        '''
+
+        left, top = corner
+
+        # A function that converts a point to a position on the surface
+        def convert (point):
+            return pygame.Vector2((point[0] - left) * scale, (top - point[1]) * scale)
+
+        for kind, command_box, data in self.find(box):
+
+            # A line through some points
+            if kind == "stroke":
+                points, color, width, antialias = data
+                width = max(1, round(width * scale))
+                pgputils.draw_stroke(surface, color, [convert(p) for p in points],
+                                     width, antialias)
+
+            # An arc or a ring around a center
+            elif kind == "arc":
+                center, radius, start_angle, angle, color, width = data
+                width = max(1, round(width * scale))
+                pgputils.draw_arc(surface, color, convert(center), radius * scale,
+                                  start_angle, angle, width)
+
+            # A filled circle
+            elif kind == "dot":
+                center, diameter, color = data
+                pygame.draw.circle(surface, color, convert(center), diameter * scale / 2)
+
+            # A filled polygon
+            elif kind == "polygon":
+                points, color = data
+                pygame.draw.polygon(surface, color, [convert(p) for p in points])
+
+            # A picture with its top left corner at a point
+            elif kind == "image":
+                image, image_corner = data
+                if scale != 1:
+                    size = (max(1, round(image.get_width() * scale)),
+                            max(1, round(image.get_height() * scale)))
+                    image = pygame.transform.smoothscale(image, size)
+                surface.blit(image, convert(image_corner))
+
+            # Erase a rectangle
+            elif kind == "clear_rect":
+                c_left, c_bottom, c_right, c_top = command_box
+                top_left = convert((c_left, c_top))
+                bottom_right = convert((c_right, c_bottom))
+                surface.fill(0, pygame.Rect(top_left, bottom_right - top_left))
+
+            # Erase a circle
+            elif kind == "clear_circle":
+                center, radius = data
+                pygame.draw.circle(surface, 0, convert(center), radius * scale)
+
+
+__all__ = [
+    "DisplayList"
+]
@@ -0,0 +1,384 @@
+# Copyright 2022 Casey Devet
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+################################################################################
+#                               GLOBAL VARIABLES
+################################################################################
+
+import io
+import itertools
+import json
+import os
+import sys
+import weakref
+
+import pygame
+
+# The version of the saved font index.  Change this if the format changes.
+_INDEX_VERSION = 1
+
+# The names used for the styles of a font in the index
+_STYLE_NAMES = {
+    (False, False): "regular",
+    (True, False): "bold",
+    (False, True): "italic",
+    (True, True): "bolditalic"
+}
+
+
+# A helper function that simplifies a font name the same way that pygame does
+# (e.g. "Comic Sans MS" becomes "comicsansms")
+def _simplify_name (name):
+    return "".join([c.lower() for c in name if c.isalnum()])
+
+
+# A helper function that returns the file where the font index is saved
+def _default_cache_file ():
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pygameplus", "fonts.json")
+
+
+# A helper function that returns the directories where fonts are installed
+def _font_directories ():
+    if sys.platform == "win32":
+        windir = os.environ.get("WINDIR", "C:\\Windows")
+        directories = [os.path.join(windir, "Fonts")]
+        if "LOCALAPPDATA" in os.environ:
+            directories.append(os.path.join(os.environ["LOCALAPPDATA"],
+                                            "Microsoft", "Windows", "Fonts"))
+    elif sys.platform == "darwin":
+        directories = ["/Library/Fonts", "/System/Library/Fonts",
+                       os.path.expanduser("~/Library/Fonts")]
+    else:
+        data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        directories = ["/usr/share/fonts", "/usr/local/share/fonts",
+                       os.path.expanduser("~/.fonts"),
+                       os.path.join(data_home, "fonts")]
+    return directories
+
+
+# A helper function that returns the modification times of the font
+# directories and all of the folders inside them.  If a font is added or
+# removed anywhere in them, one of these will change.
+def _font_directory_stamp ():
+    stamp = {}
+    for directory in _font_directories():
+        for folder, _, _ in os.walk(directory):
+            try:
+                stamp[folder] = os.stat(folder).st_mtime
+            except OSError:
+                pass
+    return stamp
+
+
+################################################################################
+#                             FONT REGISTRY CLASS
+################################################################################
+
+class FontRegistry (object):
+    '''
+    A FontRegistry finds the fonts that are installed on the computer and
+    hands out Font objects for them.
+
+    Finding the system fonts can be slow, so the registry only does it once
+    per program.  If `persistent` is turned on, what it found is also saved 
+    to a file and used the next time a program runs, unless fonts have been 
+    installed or removed since.  Font objects are also kept, so asking for the same font, size and style
+    again gives back the same object.
+
+    You will not be able to create your own FontRegistry.  Instead, you
+    should use the `font_registry` variable, included in this module, which
+    contains the single possible FontRegistry object.
+    '''
+
+    # Used to enforce this as a singleton class
+    __the_font_registry = None
+
+    def __init__ (self):
+        '''
+        Creates the single FontRegistry object.  DO NOT USE!
+        The `font_registry` variable holds the single possible
+        FontRegistry.
+        '''
+
+        # Throw an error if the singleton has already been created.
+        if FontRegistry.__the_font_registry is not None:
+            raise Exception('The font registry has already been created!')
+        FontRegistry.__the_font_registry = self
+
+        # The index of system fonts is only loaded when it is needed
+        self._index = None
+        self._persistent = False
+        self._cache_file = _default_cache_file()
+
+        # Caches for Font objects and the contents of font files
+        self._fonts = {}
+        self._files = {}
+
+        # What each Font object was loaded from, without keeping the Font
+        # objects alive.  Fonts that weren't made by the registry are given
+        # a number instead.
+        self._identities = weakref.WeakKeyDictionary()
+        self._font_numbers = itertools.count(1)
+
+
+    ### Properties
+
+    @property
+    def persistent (self):
+        '''
+        Whether or not the index of system fonts is saved to a file so that
+        it can be used the next time a program runs.
+
+        This is off by default, so nothing is written to the `cache_file` 
+        unless you turn it on.  If the file can't be read or written, the 
+        fonts are just found again.
+        '''
+
+        return self._persistent
+
+    @persistent.setter
+    def persistent (self, is_persistent):
+
+        self._persistent = bool(is_persistent)
+
+
+    @property
+    def cache_file (self):
+        '''
+        The file where the index of system fonts is saved.
+        '''
+
+        return self._cache_file
+
+    @cache_file.setter
+    def cache_file (self, new_file):
+
+        self._cache_file = os.fspath(new_file)
+        self._index = None
+
+
+    ### Finding Fonts
+
+    # A hidden method that returns the index of the system fonts.  The index
+    # maps simplified font names to the files for each style.
+    def _get_index (self):
+        if self._index is None:
+            # The stamp is only needed to check the saved index, so the font
+            # directories are only looked through when the index is saved
+            if self._persistent:
+                stamp = _font_directory_stamp()
+                self._index = self._load_index(stamp)
+            if self._index is None:
+                self._index = self._build_index()
+                if self._persistent:
+                    self._save_index(stamp)
+        return self._index
+
+
+    # A hidden method that loads the saved index if it is still up to date.
+    # Returns None if it can't be used.
+    def _load_index (self, stamp):
+        try:
+            with open(self._cache_file, encoding="utf-8") as file:
+                saved = json.load(file)
+            if (saved["version"] != _INDEX_VERSION or
+                    saved["pygame"] != pygame.version.ver or
+                    saved["stamp"] != stamp):
+                return None
+            return saved["fonts"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+    # A hidden method that saves the index.  If the file can't be written,
+    # the index just won't be saved.
+    def _save_index (self, stamp):
+        saved = {
+            "version": _INDEX_VERSION,
+            "pygame": pygame.version.ver,
+            "stamp": stamp,
+            "fonts": self._index
+        }
+        temp_file = self._cache_file + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as file:
+                json.dump(saved, file)
+            os.replace(temp_file, self._cache_file)
+        except OSError:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+
+    # A hidden method that asks pygame for all of the system fonts
+    def _build_index (self):
+        index = {}
+        for name in pygame.font.get_fonts():
+            styles = {}
+            for (bold, italic), style_name in _STYLE_NAMES.items():
+                path = pygame.font.match_font(name, bold, italic)
+                if path is not None:
+                    styles[style_name] = path
+            if styles:
+                index[_simplify_name(name)] = styles
+        return index
+
+
+    def refresh (self):
+        '''
+        Find the system fonts again.
+
+        Use this if fonts were installed while the program is running.
+        '''
+
+        self._index = self._build_index()
+        if self._persistent:
+            self._save_index(_font_directory_stamp())
+
+
+    def get_fonts (self):
+        '''
+        Get a list of the names of all of the fonts installed on the computer.
+        '''
+
+        return sorted(self._get_index())
+
+
+    def find_font (self, name, bold=False, italic=False):
+        '''
+        Find the file of a font installed on the computer.
+
+        The `name` can be a single font name or a list of names separated
+        by commas, in which case the first one found is used.
+
+        If there is no file for the given style, the file for the regular
+        style is given.  If the font can't be found, `None` is returned.
+        '''
+
+        path, _ = self._find_font(name, bold, italic)
+        return path
+
+
+    # A hidden method that finds the file of a system font.  Also returns
+    # whether or not the file has the requested style.
+    def _find_font (self, name, bold=False, italic=False):
+        index = self._get_index()
+        for single_name in str(name).split(","):
+            styles = index.get(_simplify_name(single_name))
+            if styles:
+                path = styles.get(_STYLE_NAMES[bold, italic])
+                if path is not None:
+                    return path, True
+                path = styles.get("regular", next(iter(styles.values())))
+                return path, False
+        return None, False
+
+
+    ### Getting Fonts
+
+    def get_font (self, font=None, size=12, style=None):
+        '''
+        Get a Font object.
+
+        The `font` can be the name of a font on the system or a True Type
+        Font file (.ttf) located in the directory.  If it is `None` or the
+        font can't be found, pygame's default font is used.
+
+        The `size` is the height of the text in pixels.
+
+        The `style` argument can be "bold", "italic", "underline" or a
+        combination separated by space (e.g. "bold italic").
+
+        The same Font object is given every time the same font, size and
+        style are asked for, so don't change its style.
+        '''
+
+        # Get the styles
+        if style is None:
+            style = ()
+        elif isinstance(style, str):
+            style = tuple(sorted(set(style.lower().split())))
+        else:
+            style = tuple(sorted({s.lower() for s in style}))
+
+        # Check if the font has already been created
+        if font is not None and not isinstance(font, str):
+            font = os.fspath(font)
+        key = (font, size, style)
+        if key in self._fonts:
+            return self._fonts[key]
+
+        bold = "bold" in style
+        italic = "italic" in style
+
+        # Load font files from their contents, which are only read once
+        if font is not None and font.lower().endswith((".ttf", ".otf")):
+            path = os.path.abspath(font)
+            if path not in self._files:
+                with open(path, "rb") as file:
+                    self._files[path] = file.read()
+            font_obj = pygame.font.Font(io.BytesIO(self._files[path]), size)
+            has_style = False
+
+        # Otherwise, find the system font
+        else:
+            path, has_style = (None, False) if font is None else self._find_font(font, bold, italic)
+            font_obj = pygame.font.Font(path, size)
+
+        # Apply the styles that aren't part of the font file
+        if not has_style:
+            font_obj.set_bold(bold)
+            font_obj.set_italic(italic)
+        font_obj.set_underline("underline" in style)
+
+        self._fonts[key] = font_obj
+        self._identities[font_obj] = (path, size)
+        return font_obj
+
+
+    # A hidden method that returns a tuple that tells what a Font object was
+    # loaded from.  Two Font objects with the same identity and style draw
+    # the same text.
+    def _font_identity (self, font_obj):
+        identity = self._identities.get(font_obj)
+        if identity is None:
+            identity = (next(self._font_numbers),)
+            self._identities[font_obj] = identity
+        return identity
+
+
+font_registry = FontRegistry()
+font_registry.__doc__ = '''
+        The registry that finds system fonts and hands out Font objects.
+        See the `FontRegistry` class for details.
+        '''
+
+__all__ = [
+    'FontRegistry',
+    'font_registry'
+]
@@ -22,12 +22,18 @@
 #                               GLOBAL VARIABLES
 ################################################################################
 
+import contextlib
+import warnings
+import weakref
+
 import pygame
 from pygame.locals import *
 
 from . import pgputils
 from .screen import get_active_screen
 from .music import MUSIC_END, music_stream
+from .inputstate import keyboard, _key_name
+from .timers import TimerQueue
 
 
 ################################################################################
@@ -50,12 +56,20 @@ class GameLoop (object):
     GameLoop objects store the following information about an event loop:
      - Whether or not the event loop is running
      - The frame rate that the loop should try to maintain
+     - The rate that the sprites are updated
+     - The time between updates
 
     Methods are provided for the following:
      - To get or change the frame rate
      - To start and stop the loop
+     - To animate sprites together
     '''
 
+    # The longest time (in seconds) that one frame can move the game 
+    # forward.  If the program freezes for a while (e.g. while the window is
+    # being dragged), the game doesn't try to catch up all at once.
+    _max_frame_time = 0.25
+
     def __init__ (self, frame_rate=40):
         '''
         Create an GameLoop object.
@@ -72,11 +86,52 @@ class GameLoop (object):
         self._running = False
         self._frame_rate = frame_rate
 
+        # Attributes for updating the sprites.  If there is an update rate,
+        # the sprites are updated that many times per second no matter how
+        # often the screen is drawn.  The leftover time that isn't enough
+        # for a whole update is kept for the next frame.
+        self._update_rate = None
+        self._dt = 1 / frame_rate
+        self._leftover_time = 0
+        self._interpolation = 1
+
         # Attribute to hold which sprites are currently being clicked on
         self._clicked_sprites = [None for _ in range(5)]
 
-        # Attribute to hold timer event handlers
-        self._timers = {}
+        # The timers that are run while the loop is running
+        self._timers = TimerQueue()
+
+        # Attributes for the table of event handlers.  The version changes
+        # when the loop's handlers change and the table is built again when
+        # the version or the screen's handlers change.
+        self._dispatch = {}
+        self._dispatch_version = None
+        self._handler_version = 0
+
+        # The screen's key hold handlers as they were when the table was 
+        # built.  Handlers that are added or removed during a frame are 
+        # used starting with the next frame.
+        self._key_holds = ()
+
+        # The sprites that have mouse handlers
+        self._mouse_sprites = weakref.WeakSet()
+
+        # Attributes for combining the mouse motions in each frame.  The path
+        # holds the positions (in window coordinates) that haven't been 
+        # handled yet.
+        self._coalesce_mouse_motion = False
+        self._motion_path = []
+
+        # Attributes for the scheduler that animates sprites.  The sprites
+        # that are being animated are kept in order in a dictionary.  The 
+        # loop can be started just to play the animations and the animations
+        # can be held back so that several can be started together.  The
+        # updates are counted so that sprites can tell when an update has
+        # passed.
+        self._animations = {}
+        self._stop_after_animations = False
+        self._animation_holds = 0
+        self._update_count = 0
 
 
     @property
@@ -141,6 +196,99 @@ class GameLoop (object):
         self._frame_rate = 1000 / new_delay
 
 
+    @property
+    def update_rate (self):
+        '''
+        The number of times per second that the sprites are updated, or 
+        `None` to update them once for every frame (the default).
+
+        With an update rate, the game runs at the same speed even if the
+        frame rate changes or some frames take a long time to draw.  The
+        screen is drawn as often as the frame rate allows and sprites are
+        drawn part of the way between updates so that they move smoothly.
+        '''
+
+        return self._update_rate
+
+    @update_rate.setter
+    def update_rate (self, new_update_rate):
+
+        if new_update_rate is None:
+            self._update_rate = None
+            self._interpolation = 1
+            return
+
+        # Ensure the the given update rate is a number
+        try:
+            new_update_rate = float(new_update_rate)
+        except:
+            raise ValueError("The update rate must be a number!") from None
+
+        # Ensure that the given update rate is positive
+        if new_update_rate <= 0:
+            raise ValueError("The update rate must be positive!")
+
+        self._update_rate = new_update_rate
+        self._dt = 1 / new_update_rate
+
+
+    @property
+    def dt (self):
+        '''
+        The time (in seconds) that the last update moved the game 
+        forward.  (Read-only)
+
+        If there is an update rate, this is always 1 divided by the update
+        rate.  Otherwise, it is the time that the last frame took.
+        '''
+
+        return self._dt
+
+    @dt.setter
+    def dt (self, new_dt):
+
+        raise AttributeError("This property is read-only!")
+
+
+    @property
+    def interpolation (self):
+        '''
+        How far (from 0 to 1) the screen is drawn between the previous and
+        the latest update.  (Read-only)
+
+        This is always 1 if there is no update rate.
+        '''
+
+        return self._interpolation
+
+    @interpolation.setter
+    def interpolation (self, new_interpolation):
+
+        raise AttributeError("This property is read-only!")
+
+
+    @property
+    def coalesce_mouse_motion (self):
+        '''
+        Whether or not the mouse motions in each frame are combined.
+
+        A fast mouse can move many times in one frame.  Normally, the mouse
+        move and drag handlers are called for every one of these motions.  
+        If this is `True`, the handlers are only called once per frame with
+        the latest position of the mouse.  The `path` argument of the 
+        handlers will have all of the positions that the mouse moved
+        through, so that you can draw them all at once.
+        '''
+
+        return self._coalesce_mouse_motion
+
+    @coalesce_mouse_motion.setter
+    def coalesce_mouse_motion (self, is_coalesced):
+
+        self._coalesce_mouse_motion = bool(is_coalesced)
+        self._handler_version += 1
+
+
     @property
     def running (self):
         '''
@@ -167,10 +315,21 @@ class GameLoop (object):
         '''
 
         self._running = True
+
+        # Restart the clock so that the time before the loop started isn't
+        # counted
+        self._clock.tick()
+        self._leftover_time = 0
+
+        # Find out if any of the keys with hold handlers are already down
+        screen = get_active_screen()
+        if screen is not None:
+            keyboard._sync(screen._key_hold_funcs)
+
         while self._running:
             # Force the loop to wait if the entire frame delay has not passed 
             # since the start of the last iteration
-            self._tick_clock()
+            frame_time = min(self._tick_clock() / 1000, GameLoop._max_frame_time)
 
             # Get the active screen
             screen = get_active_screen()
@@ -178,6 +337,8 @@ class GameLoop (object):
                 continue
 
             # Loop through the events that have occurred over the past frame
+            # and call the handlers for the ones that have them
+            dispatch = self._get_dispatch(screen)
             for event in pygame.event.get():
                 # If the close button is clicked, end the loop
                 if event.type == QUIT:
@@ -188,112 +349,320 @@ class GameLoop (object):
                     pygame.display.quit()
                     return
 
-                # If a key was pressed, call any associated handlers
-                elif event.type == KEYDOWN:
-                    if event.key in screen._key_press_funcs:
-                        pgputils.call_with_args(screen._key_press_funcs[event.key],
-                                        key=pygame.key.name(event.key))
-                    elif None in screen._key_press_funcs:
-                        pgputils.call_with_args(screen._key_press_funcs[None],
-                                        key=pygame.key.name(event.key))
-
-                # If a key was released, call any associated handlers
-                elif event.type == KEYUP:
-                    if event.key in screen._key_release_funcs:
-                        pgputils.call_with_args(screen._key_release_funcs[event.key],
-                                        key=pygame.key.name(event.key))
-                    elif None in screen._key_release_funcs:
-                        pgputils.call_with_args(screen._key_release_funcs[None],
-                                        key=pygame.key.name(event.key))
-
-                # If a mouse button is clicked down, call any associated handlers
-                elif event.type == MOUSEBUTTONDOWN:
-                    button = event.button
-                    button_name = pgputils.mouse_button_reverse_map[button]
-                    pos = screen.from_pygame_coordinates(event.pos)
-                    sprites = screen.sprites()
-                    sprites.reverse()
-                    for sprite in sprites:
-                        func = sprite._click_funcs[button - 1]
-                        if func is None:
-                            continue
-                        method = sprite._click_methods[button - 1]
-                        bleeds = sprite._click_bleeds[button - 1]
-                        if sprite.is_touching_point(pos, method=method):
-                            self._clicked_sprites[button - 1] = sprite
-                            if sprite._click_funcs[button - 1] is not None and not sprite.disabled:
-                                pgputils.call_with_args(sprite._click_funcs[button - 1],
-                                                pos=pos, x=pos[0], y=pos[1], 
-                                                button=button, sprite=sprite)
-                            if not bleeds:
-                                break
-                    if screen._click_funcs[button - 1] is not None:
-                        pgputils.call_with_args(screen._click_funcs[button - 1],
-                                        pos=pos, x=pos[0], y=pos[1], 
-                                        button=button_name)
-
-                # If a mouse button is released, call any associated handlers
-                elif event.type == MOUSEBUTTONUP:
-                    button = event.button
-                    button_name = pgputils.mouse_button_reverse_map[button]
-                    pos = screen.from_pygame_coordinates(event.pos)
-                    sprite = self._clicked_sprites[button - 1]
-                    if sprite and sprite._release_funcs[button - 1] is not None and not sprite.disabled:
-                        pgputils.call_with_args(sprite._release_funcs[button - 1],
-                                        pos=pos, x=pos[0], y=pos[1], 
-                                        button=button_name, sprite=sprite)
-                    self._clicked_sprites[button - 1] = None
-                    if screen._release_funcs[button - 1] is not None:
-                        pgputils.call_with_args(screen._release_funcs[button - 1],
-                                        pos=pos, x=pos[0], y=pos[1], 
-                                        button=button_name)
-
-                # If the mouse moves and a button is down, call any associated
-                # drag handlers
-                elif event.type == MOUSEMOTION:
-                    pos = screen.from_pygame_coordinates(event.pos)
-                    for button, sprite in enumerate(self._clicked_sprites, 1):
-                        button_name = pgputils.mouse_button_reverse_map[button]
-                        if sprite and sprite._drag_funcs[button - 1] is not None and not sprite.disabled:
-                            pgputils.call_with_args(sprite._drag_funcs[button - 1],
-                                            pos=pos, x=pos[0], y=pos[1], 
-                                            button=button_name, sprite=sprite)
-                    if screen._mouse_move_func is not None:
-                        pgputils.call_with_args(screen._mouse_move_func,
-                                        pos=pos, x=pos[0], y=pos[1])
-
-                # If this event is a music end, manage the music stream
-                elif event.type == MUSIC_END:
-                    music_stream._handle_end_event()         
-
-                # If this event type matches a screen timer, call it's handler.
-                elif event.type in screen._timers:
-                    pgputils.call_with_args(screen._timers[event.type])
-
-                # If this event type matches a global timer, call it's handler.
-                elif event.type in self._timers:
-                    pgputils.call_with_args(self._timers[event.type])
-
-            # Get a dictionary containing the state of the keyboard keys
-            keys = pygame.key.get_pressed()
-            key_count = keys.count(1)
-
-            # Loop through the keyhold handlers and call any for which the 
-            # key is down
-            try:
-                for key_code, func in screen._key_hold_funcs.items():
-                    if key_code is None and key_count > 0:
-                        pgputils.call_with_args(func)
-                    elif key_code is not None and keys[key_code]:
-                        pgputils.call_with_args(func, key=pygame.key.name(key_code))
-            except RuntimeError:
-                pass
-
-            # Update the active screen
-            screen.update()
-            screen.draw()
+                # Call the handler, if there is one.  The handlers might be
+                # changed by the handler, so check the table again.
+                handler = dispatch.get(event.type)
+                if handler is not None:
+                    handler(screen, event)
+                    dispatch = self._get_dispatch(screen)
+
+            # Handle the mouse motions that were combined
+            if self._motion_path:
+                self._flush_mouse_motion(screen)
+
+            # Call the handlers of the timers that have gone off.  The 
+            # screen's timers go first.
+            now = pygame.time.get_ticks()
+            screen._timers.run(now)
+            self._timers.run(now)
+
+            # Without an update rate, update once for the whole frame
+            if self._update_rate is None:
+                self._dt = frame_time
+                self._update(screen)
+                screen.draw()
+
+            # Otherwise, update as many times as fit in the time that has
+            # passed and draw the sprites part of the way to the next update
+            else:
+                self._dt = 1 / self._update_rate
+                self._leftover_time += frame_time
+                while self._leftover_time >= self._dt and self._running:
+                    screen._store_positions()
+                    self._update(screen)
+                    self._leftover_time -= self._dt
+                self._interpolation = min(1, self._leftover_time / self._dt)
+                screen._interpolation = self._interpolation
+                try:
+                    screen.draw()
+                finally:
+                    screen._interpolation = None
             pygame.display.flip()
 
+            # If the loop was only started to play the animations, end it
+            # once they are all finished.  This doesn't use stop(), so the
+            # timers that were set before the animations aren't cancelled.
+            if self._stop_after_animations and not self._animations:
+                self._stop_after_animations = False
+                self._running = False
+
+        self._stop_after_animations = False
+
+
+    ### Methods for the animation scheduler
+
+    # A hidden method that adds a sprite to the animations.  The sprite must
+    # have an `_advance_animation(dt)` method that animates it by `dt` 
+    # seconds and returns whether or not it still has more to animate.
+    def _add_animation (self, sprite):
+        self._animations[sprite] = None
+
+        # If the game loop is not running, start it up to play the animation
+        if not self._running and self._animation_holds == 0:
+            self.wait_for_animations()
+
+
+    # A hidden method that animates all of the sprites by one update
+    def _advance_animations (self):
+        self._update_count += 1
+        for sprite in list(self._animations):
+            if not sprite._advance_animation(self._dt):
+                self._animations.pop(sprite, None)
+
+
+    def wait_for_animations (self):
+        '''
+        Run the game loop until all of the animations are finished.
+
+        This has no effect if the game loop is already running.
+        '''
+
+        if self._animations and not self._running:
+            self._stop_after_animations = True
+            self.start()
+
+
+    @contextlib.contextmanager
+    def animate_together (self):
+        '''
+        Animate several sprites at the same time.
+
+        Use this in a `with` statement.  The movements made inside the `with`
+        block are not played right away.  Instead, they are all played 
+        together at the end of the block.  For example:
+
+            with game_loop.animate_together():
+                turtle1.move_forward(100)
+                turtle2.move_forward(100)
+
+        If a sprite is given more than one movement, it will do them one 
+        after another.
+        '''
+
+        self._animation_holds += 1
+        try:
+            yield
+        finally:
+            self._animation_holds -= 1
+        if self._animation_holds == 0:
+            self.wait_for_animations()
+
+
+    ### Methods to handle events
+
+    # A hidden method that gets the table that maps event types to the
+    # methods that handle them.  The table only has the event types that 
+    # the screen and sprites have handlers for, so the other events are 
+    # skipped.  It is only built again when the handlers change.
+    def _get_dispatch (self, screen):
+        version = (screen, screen._handler_version, self._handler_version)
+        if version == self._dispatch_version:
+            return self._dispatch
+
+        # The keys are always handled so that the keyboard is kept up to 
+        # date
+        dispatch = {
+            MUSIC_END: self._handle_music_end,
+            KEYDOWN: self._handle_key_press,
+            KEYUP: self._handle_key_release,
+            WINDOWFOCUSLOST: self._handle_focus_lost,
+            WINDOWFOCUSGAINED: self._handle_focus_gained
+        }
+        self._key_holds = tuple(screen._key_hold_funcs.items())
+
+        # The sprites' mouse handlers are checked whenever any sprite has one
+        mouse_sprites = len(self._mouse_sprites) > 0
+        if mouse_sprites or any(screen._click_funcs):
+            dispatch[MOUSEBUTTONDOWN] = self._handle_mouse_down
+        if mouse_sprites or any(screen._release_funcs):
+            dispatch[MOUSEBUTTONUP] = self._handle_mouse_up
+        if mouse_sprites or screen._mouse_move_func is not None:
+            if self._coalesce_mouse_motion:
+                dispatch[MOUSEMOTION] = self._queue_mouse_motion
+            else:
+                dispatch[MOUSEMOTION] = self._handle_mouse_motion
+        else:
+            self._motion_path = []
+        if not mouse_sprites:
+            self._clicked_sprites = [None for _ in range(5)]
+
+        self._dispatch = dispatch
+        self._dispatch_version = version
+        return dispatch
+
+
+    # A hidden method that adds or removes a sprite from the sprites that
+    # have mouse handlers.
+    def _set_mouse_sprite (self, sprite, has_handlers):
+        if has_handlers and sprite not in self._mouse_sprites:
+            self._mouse_sprites.add(sprite)
+            self._handler_version += 1
+        elif not has_handlers and sprite in self._mouse_sprites:
+            self._mouse_sprites.discard(sprite)
+            self._handler_version += 1
+
+
+    # If a key was pressed, update the keyboard and call any associated 
+    # handlers
+    def _handle_key_press (self, screen, event):
+        keyboard._press(event.key)
+        if screen._key_press_funcs:
+            func = screen._key_press_funcs.get(event.key)
+            if func is None:
+                func = screen._key_press_funcs.get(None)
+            if func is not None:
+                pgputils.call_with_args(func, key=_key_name(event.key))
+
+
+    # If a key was released, update the keyboard and call any associated 
+    # handlers
+    def _handle_key_release (self, screen, event):
+        keyboard._release(event.key)
+        if screen._key_release_funcs:
+            func = screen._key_release_funcs.get(event.key)
+            if func is None:
+                func = screen._key_release_funcs.get(None)
+            if func is not None:
+                pgputils.call_with_args(func, key=_key_name(event.key))
+
+
+    # If the window loses focus, the key releases won't be seen, so release
+    # all of the keys
+    def _handle_focus_lost (self, screen, event):
+        keyboard._release_all()
+
+
+    # If the window gets focus, check if any keys with hold handlers are 
+    # already down
+    def _handle_focus_gained (self, screen, event):
+        keyboard._sync(screen._key_hold_funcs)
+
+
+    # If a mouse button is clicked down, call any associated handlers.  Any
+    # combined mouse motions are handled first.
+    def _handle_mouse_down (self, screen, event):
+        if self._motion_path:
+            self._flush_mouse_motion(screen)
+        button = event.button
+        button_name = pgputils.mouse_button_reverse_map[button]
+        pos = screen.from_window_coordinates(event.pos)
+        if self._mouse_sprites:
+            sprites = screen.sprites()
+            sprites.reverse()
+            for sprite in sprites:
+                if not hasattr(sprite, "_click_funcs"):
+                    continue
+                func = sprite._click_funcs[button - 1]
+                if func is None:
+                    continue
+                method = sprite._click_methods[button - 1]
+                bleeds = sprite._click_bleeds[button - 1]
+                if sprite.is_touching_point(pos, method=method):
+                    self._clicked_sprites[button - 1] = sprite
+                    if sprite._click_funcs[button - 1] is not None and not sprite.disabled:
+                        pgputils.call_with_args(sprite._click_funcs[button - 1],
+                                        pos=pos, x=pos[0], y=pos[1], 
+                                        button=button, sprite=sprite)
+                    if not bleeds:
+                        break
+        if screen._click_funcs[button - 1] is not None:
+            pgputils.call_with_args(screen._click_funcs[button - 1],
+                            pos=pos, x=pos[0], y=pos[1], 
+                            button=button_name)
+
+
+    # If a mouse button is released, call any associated handlers.  Any
+    # combined mouse motions are handled first.
+    def _handle_mouse_up (self, screen, event):
+        if self._motion_path:
+            self._flush_mouse_motion(screen)
+        button = event.button
+        button_name = pgputils.mouse_button_reverse_map[button]
+        pos = screen.from_window_coordinates(event.pos)
+        sprite = self._clicked_sprites[button - 1]
+        if sprite and sprite._release_funcs[button - 1] is not None and not sprite.disabled:
+            pgputils.call_with_args(sprite._release_funcs[button - 1],
+                            pos=pos, x=pos[0], y=pos[1], 
+                            button=button_name, sprite=sprite)
+        self._clicked_sprites[button - 1] = None
+        if screen._release_funcs[button - 1] is not None:
+            pgputils.call_with_args(screen._release_funcs[button - 1],
+                            pos=pos, x=pos[0], y=pos[1], 
+                            button=button_name)
+
+
+    # If the mouse moves, call the mouse move handler and, if a button is 
+    # down, any associated drag handlers
+    def _handle_mouse_motion (self, screen, event):
+        pos = screen.from_window_coordinates(event.pos)
+        self._call_motion_handlers(screen, pos, [pos])
+
+
+    # If the mouse moves while combining the motions, save the position to
+    # be handled at the end of the frame
+    def _queue_mouse_motion (self, screen, event):
+        self._motion_path.append(event.pos)
+
+
+    # A hidden method that handles the combined mouse motions
+    def _flush_mouse_motion (self, screen):
+        path = [screen.from_window_coordinates(p) for p in self._motion_path]
+        self._motion_path = []
+        self._call_motion_handlers(screen, path[-1], path)
+
+
+    # A hidden method that calls the mouse move and drag handlers
+    def _call_motion_handlers (self, screen, pos, path):
+        for button, sprite in enumerate(self._clicked_sprites, 1):
+            if sprite and sprite._drag_funcs[button - 1] is not None and not sprite.disabled:
+                button_name = pgputils.mouse_button_reverse_map[button]
+                pgputils.call_with_args(sprite._drag_funcs[button - 1],
+                                pos=pos, x=pos[0], y=pos[1], path=path,
+                                button=button_name, sprite=sprite)
+        if screen._mouse_move_func is not None:
+            pgputils.call_with_args(screen._mouse_move_func,
+                            pos=pos, x=pos[0], y=pos[1], path=path)
+
+
+    # If this event is a music end, manage the music stream
+    def _handle_music_end (self, screen, event):
+        music_stream._handle_end_event()
+
+
+    # A hidden method that moves the game forward by one update
+    def _update (self, screen):
+
+        # Loop through the keyhold handlers and call any for which the 
+        # key is down.  A key that was pressed and released since the last
+        # update counts as being held for this update.
+        pressed = keyboard._pressed
+        just_pressed = keyboard._just_pressed
+        if pressed or just_pressed:
+            for key_code, func in self._key_holds:
+                if key_code is None:
+                    pgputils.call_with_args(func, dt=self._dt)
+                elif key_code in pressed or key_code in just_pressed:
+                    pgputils.call_with_args(func, key=_key_name(key_code),
+                                            dt=self._dt)
+
+        # Animate all of the sprites and update the active screen
+        self._advance_animations()
+        screen.update()
+
+        # The keys pressed and released have been seen by this update, so
+        # the next update only sees new ones
+        keyboard._end_update()
+
 
     def stop (self):
         '''
@@ -305,9 +674,7 @@ class GameLoop (object):
         '''
 
         self._running = False
-
-        for timer_id in list(self._timers.keys()):
-            self.cancel_timer(timer_id)
+        self._timers.clear()
 
 
     def kill (self):
@@ -329,9 +696,12 @@ class GameLoop (object):
         positive number.
 
         If `repeat` is `True`, then the timer will run repeatedly.  That is,
-        the timer will restart every time that it expires.
+        the timer will restart every time that it expires.  Timers are 
+        checked once per frame, so a repeating timer that is shorter than a
+        frame is called several times in a row to keep up, up to 10 times
+        per frame.
 
-        An event ID will be returned that can be used with the `cancel_timer()`
+        A timer ID will be returned that can be used with the `cancel_timer()`
         method to stop the timer.
         '''
 
@@ -341,30 +711,29 @@ class GameLoop (object):
         if delay <= 0:
             raise ValueError("The delay must be positive!")
 
-        # Get a custom pygame event type and start the timer
-        event_id = pygame.event.custom_type()
-        self._timers[event_id] = func
-        pygame.time.set_timer(event_id, delay, not repeat)
-
-        # Return the custom event type for cancelling
-        return event_id
+        # Start the timer and return its ID for cancelling
+        return self._timers.add(func, delay, repeat)
 
 
-    def cancel_timer (self, event_id):
+    def cancel_timer (self, timer_id=None, *, event_id=None):
         '''
-        Stop the timer with the given event ID.
+        Stop the timer with the given ID.
 
-        `event_id` must be an event ID that was returned from the `on_timer()`
-        method for this GameLoop.
+        `timer_id` must be a timer ID that was returned from the `on_timer()`
+        method for this GameLoop.  The old `event_id` keyword still works, 
+        but is deprecated.
         '''
 
-        # Check that the argument is a valid event type
-        if event_id not in self._timers:
-            raise ValueError("There is no global timer with that event ID!")
+        # Accept the old name of the argument
+        if event_id is not None:
+            warnings.warn("The event_id argument is deprecated!  Use timer_id instead.",
+                          DeprecationWarning, 2)
+            if timer_id is None:
+                timer_id = event_id
 
-        # Stop the timer
-        pygame.time.set_timer(event_id, 0)
-        self._timers.pop(event_id)
+        # Check that the argument is a valid timer and stop it
+        if not self._timers.cancel(timer_id):
+            raise ValueError("There is no global timer with that timer ID!")
 
 
 ################################################################################
@@ -400,6 +769,21 @@ def end_game ():
     _game_loop.stop()
 
 
+def animate_together ():
+    '''
+    Animate several sprites at the same time.
+
+    Use this in a `with` statement.  The movements made inside the `with`
+    block are all played together at the end of the block.  For example:
+
+        with animate_together():
+            turtle1.move_forward(100)
+            turtle2.move_forward(100)
+    '''
+
+    return _game_loop.animate_together()
+
+
 def get_game_loop ():
     '''
     Returns the event loop object.
@@ -415,5 +799,6 @@ def get_game_loop ():
 __all__ = [
     "start_game",
     "end_game",
+    "animate_together",
     "get_game_loop"
 ]
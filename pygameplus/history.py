@@ -0,0 +1,256 @@
+# Copyright 2022 Casey Devet
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+################################################################################
+#                               GLOBAL VARIABLES
+################################################################################
+
+import collections
+import zlib
+
+import pygame
+
+################################################################################
+#                             CANVAS HISTORY CLASS
+################################################################################
+
+class CanvasHistory (object):
+    '''
+    A CanvasHistory keeps track of the changes made to a canvas so that they
+    can be undone and redone.
+
+    Instead of copying the whole canvas for each change, the canvas is split
+    into square tiles and only the tiles that are drawn on are saved.  A tile
+    is saved the first time it is drawn on in each step, so undoing a small
+    stroke only needs to restore a few small tiles.
+
+    Everything drawn between two checkpoints is one step that is undone or
+    redone all at once.  When the saved tiles use more than the memory
+    limit, the oldest steps are forgotten.
+
+    You will not usually need to use a CanvasHistory directly.  Use the
+    `start_history()` method of a Screen instead.
+    '''
+
+    # The width and height of the tiles
+    _tile_size = 64
+
+    def __init__ (self, canvas, max_memory=64, compress=False):
+        '''
+        Create a CanvasHistory for a canvas.
+
+        The `max_memory` is the most memory (in megabytes) that the saved
+        tiles can use.  If `compress` is `True`, the saved tiles are
+        compressed, which uses less memory but takes more time.
+        '''
+
+        # Ensure that the memory limit is a positive number
+        try:
+            max_memory = float(max_memory)
+        except:
+            raise ValueError("The maximum memory must be a number!") from None
+        if max_memory <= 0:
+            raise ValueError("The maximum memory must be positive!")
+
+        self._canvas = canvas
+        self._max_memory = max_memory * 1024 * 1024
+        self._compress = bool(compress)
+
+        # The tiles saved in the current step and the steps that can be undone
+        # and redone.  Each step is a dictionary mapping the column and row
+        # of a tile to its saved contents.
+        self._current = {}
+        self._undo_steps = collections.deque()
+        self._redo_steps = []
+        self._memory = 0
+
+
+    ### Properties
+
+    @property
+    def can_undo (self):
+        '''
+        Whether or not there is a step that can be undone.  (Read-only)
+        '''
+
+        return bool(self._current or self._undo_steps)
+
+
+    @property
+    def can_redo (self):
+        '''
+        Whether or not there is a step that can be redone.  (Read-only)
+        '''
+
+        return bool(self._redo_steps) and not self._current
+
+
+    @property
+    def memory (self):
+        '''
+        The amount of memory (in bytes) used by the saved tiles.  (Read-only)
+        '''
+
+        return self._memory
+
+
+    ### Saving and restoring tiles
+
+    # A hidden method that returns the rect of a tile clipped to the canvas
+    def _tile_rect (self, tile):
+        size = CanvasHistory._tile_size
+        rect = pygame.Rect(tile[0] * size, tile[1] * size, size, size)
+        return rect.clip(self._canvas.get_rect())
+
+
+    # A hidden method that saves the contents of a tile.  Returns the saved
+    # contents and how much memory they use.
+    def _save_tile (self, tile):
+        image = self._canvas.subsurface(self._tile_rect(tile))
+        if self._compress:
+            data = zlib.compress(pygame.image.tobytes(image, "RGBA"), 1)
+            return (data, image.get_size()), len(data)
+        image = image.copy()
+        return image, image.get_width() * image.get_height() * 4
+
+
+    # A hidden method that puts saved contents back on the canvas.  The area
+    # is erased and then the contents are added so that the pixels are
+    # copied exactly instead of being blended.
+    def _restore_tile (self, tile, saved):
+        if self._compress:
+            data, size = saved
+            saved = pygame.image.frombytes(zlib.decompress(data), size, "RGBA")
+        rect = self._tile_rect(tile)
+        self._canvas.fill(0, rect)
+        self._canvas.blit(saved, rect, special_flags=pygame.BLEND_RGBA_ADD)
+
+
+    # A hidden method that returns how much memory a step uses
+    def _step_memory (self, step):
+        return sum([memory for _, memory in step.values()])
+
+
+    ### Recording changes
+
+    def touch (self, rect):
+        '''
+        Save the tiles in the given rect of the canvas (in pygame coordinates)
+        before they are drawn on.
+
+        Tiles that were already saved in the current step are not saved again.
+        '''
+
+        rect = pygame.Rect(rect).clip(self._canvas.get_rect())
+        if rect.width == 0 or rect.height == 0:
+            return
+
+        size = CanvasHistory._tile_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                if (column, row) not in self._current:
+                    saved, memory = self._save_tile((column, row))
+                    self._current[column, row] = (saved, memory)
+                    self._memory += memory
+
+
+    def checkpoint (self):
+        '''
+        End the current step.
+
+        Everything drawn since the last checkpoint will be undone together.
+        '''
+
+        if not self._current:
+            return
+
+        # Once something new is drawn, the undone steps can't be redone
+        for step in self._redo_steps:
+            self._memory -= self._step_memory(step)
+        self._redo_steps = []
+
+        self._undo_steps.append(self._current)
+        self._current = {}
+
+        # Forget the oldest steps if too much memory is used
+        while self._memory > self._max_memory and len(self._undo_steps) > 1:
+            self._memory -= self._step_memory(self._undo_steps.popleft())
+
+
+    # A hidden method that restores the tiles of a step and returns a step
+    # with the tiles that were replaced.
+    def _swap_step (self, step):
+        other_step = {}
+        for tile, (saved, memory) in step.items():
+            other_step[tile] = self._save_tile(tile)
+            self._memory += other_step[tile][1] - memory
+            self._restore_tile(tile, saved)
+        return other_step
+
+
+    def undo (self):
+        '''
+        Undo the last step.
+
+        Returns `True` if a step was undone or `False` if there is nothing
+        to undo.
+        '''
+
+        self.checkpoint()
+        if not self._undo_steps:
+            return False
+        self._redo_steps.append(self._swap_step(self._undo_steps.pop()))
+        return True
+
+
+    def redo (self):
+        '''
+        Redo the last step that was undone.
+
+        Returns `True` if a step was redone or `False` if there is nothing
+        to redo.
+        '''
+
+        # Drawing after undoing means that the steps can't be redone
+        self.checkpoint()
+        if not self._redo_steps:
+            return False
+        self._undo_steps.append(self._swap_step(self._redo_steps.pop()))
+        return True
+
+
+    def clear (self, canvas=None):
+        '''
+        Forget all of the steps.
+
+        If a new `canvas` is given, the history will track it instead.
+        '''
+
+        if canvas is not None:
+            self._canvas = canvas
+        self._current = {}
+        self._undo_steps.clear()
+        self._redo_steps = []
+        self._memory = 0
+
+
+__all__ = [
+    "CanvasHistory"
+]
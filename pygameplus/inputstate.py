@@ -0,0 +1,232 @@
+# Copyright 2022 Casey Devet
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+################################################################################
+#                               GLOBAL VARIABLES
+################################################################################
+
+import pygame
+
+# The names of the keys that have been looked up
+_key_names = {}
+
+
+# A helper function that gets the name of a key.  The names are saved so
+# that each key only needs to be looked up once.
+def _key_name (key_code):
+    try:
+        return _key_names[key_code]
+    except KeyError:
+        name = _key_names[key_code] = pygame.key.name(key_code)
+        return name
+
+
+# A helper function that turns a key name or key code into a key code
+def _key_code (key):
+    if isinstance(key, str):
+        try:
+            return pygame.key.key_code(key)
+        except ValueError:
+            raise ValueError("Invalid key!") from None
+    if isinstance(key, int):
+        return key
+    raise ValueError("Invalid key!")
+
+
+################################################################################
+#                                KEYBOARD CLASS
+################################################################################
+
+class Keyboard (object):
+    '''
+    A Keyboard keeps track of which keys are being held down.
+
+    The keyboard is updated by the game loop as keys are pressed and
+    released, so you can check the keys at any time (e.g. in a sprite's
+    update function) instead of adding an event handler for each key:
+
+        if keyboard.is_pressed("left"):
+            player.move_left(5)
+
+    It also remembers which keys were pressed or released since the last
+    update of the game loop.  These are kept until an update has seen them,
+    so a quick tap isn't missed even if the game loop draws more often
+    than it updates.
+
+    You will not be able to create your own Keyboard.  Instead, you should
+    use the `keyboard` variable, included in this module, which contains
+    the single possible Keyboard object.
+
+    Note that the keyboard will only be updated when the game loop is
+    running.
+    '''
+
+    # Used to enforce this as a singleton class
+    __the_keyboard = None
+
+    def __init__ (self):
+        '''
+        Creates the single Keyboard object.  DO NOT USE!
+        The `keyboard` variable holds the single possible Keyboard.
+        '''
+
+        # Throw an error if the singleton has already been created.
+        if Keyboard.__the_keyboard is not None:
+            raise Exception('The keyboard has already been created!')
+        Keyboard.__the_keyboard = self
+
+        # The codes of the keys that are down and the keys that were pressed
+        # and released since the last update
+        self._pressed = set()
+        self._just_pressed = set()
+        self._just_released = set()
+
+
+    ### Properties
+
+    @property
+    def pressed (self):
+        '''
+        The names of the keys that are being held down.  (Read-only)
+        '''
+
+        return frozenset([_key_name(k) for k in self._pressed])
+
+
+    @property
+    def just_pressed (self):
+        '''
+        The names of the keys that were pressed since the last update.
+        (Read-only)
+        '''
+
+        return frozenset([_key_name(k) for k in self._just_pressed])
+
+
+    @property
+    def just_released (self):
+        '''
+        The names of the keys that were released since the last update.
+        (Read-only)
+        '''
+
+        return frozenset([_key_name(k) for k in self._just_released])
+
+
+    ### Checking Keys
+
+    def is_pressed (self, key=None):
+        '''
+        Check if a key is being held down.
+
+        The `key` can be the name of a key (e.g. "a" or "space") or a pygame
+        key code.  If no `key` is given, this checks if any key is down.
+        '''
+
+        if key is None:
+            return bool(self._pressed)
+        return _key_code(key) in self._pressed
+
+
+    def is_just_pressed (self, key=None):
+        '''
+        Check if a key was pressed since the last update.
+
+        If no `key` is given, this checks if any key was pressed.
+        '''
+
+        if key is None:
+            return bool(self._just_pressed)
+        return _key_code(key) in self._just_pressed
+
+
+    def is_just_released (self, key=None):
+        '''
+        Check if a key was released since the last update.
+
+        If no `key` is given, this checks if any key was released.
+        '''
+
+        if key is None:
+            return bool(self._just_released)
+        return _key_code(key) in self._just_released
+
+
+    ### Updating the keyboard (used by the game loop)
+
+    # A hidden method that is called at the end of each update of the game
+    # loop, forgetting the keys that were pressed and released before it.
+    def _end_update (self):
+        if self._just_pressed:
+            self._just_pressed.clear()
+        if self._just_released:
+            self._just_released.clear()
+
+
+    # A hidden method that is called when a key is pressed.  If keys repeat,
+    # a key that is already down isn't pressed again.
+    def _press (self, key_code):
+        if key_code not in self._pressed:
+            self._pressed.add(key_code)
+            self._just_pressed.add(key_code)
+
+
+    # A hidden method that is called when a key is released
+    def _release (self, key_code):
+        if key_code in self._pressed:
+            self._pressed.discard(key_code)
+            self._just_released.add(key_code)
+
+
+    # A hidden method that releases all of the keys.  This is used when the
+    # window loses focus, since the key releases won't be seen.
+    def _release_all (self):
+        self._just_released.update(self._pressed)
+        self._pressed.clear()
+
+
+    # A hidden method that asks pygame whether the given keys are down.  This
+    # is used when the game loop starts or the window gets focus, since the
+    # keys might have been pressed while nothing was watching.
+    def _sync (self, key_codes):
+        keys = pygame.key.get_pressed()
+        for key_code in key_codes:
+            if key_code is None:
+                continue
+            try:
+                is_down = keys[key_code]
+            except IndexError:
+                continue
+            if is_down:
+                self._pressed.add(key_code)
+            else:
+                self._pressed.discard(key_code)
+
+
+keyboard = Keyboard()
+keyboard.__doc__ = '''
+        The state of the keys on the keyboard.  See the `Keyboard` class
+        for details.
+        '''
+
+__all__ = [
+    'Keyboard',
+    'keyboard'
+]
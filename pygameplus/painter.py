@@ -23,11 +23,19 @@
 ################################################################################
 
 import math
+import weakref
 import pygame
 
+from . import pgputils
+from .fonts import font_registry
 from .screen import *
 from .sprite import Sprite
 
+# A helper function that returns the angle (in degrees between -180 and 180)
+# that a path turns when it changes from one direction to another.
+def _turn_angle (direction1, direction2):
+    return (direction1.angle_to(direction2) + 180) % 360 - 180
+
 ################################################################################
 #                                 COLOR CLASS
 ################################################################################
@@ -53,8 +61,13 @@ class Painter (Sprite):
      - They can write text to the screen.
     '''
 
-    # A cache that stores fonts previously used.
-    _fonts = {}
+    # Whether or not lines are collected and drawn together later
+    _buffer_drawing = False
+
+    # A cache of the most recently written text images so that writing the 
+    # same text again doesn't need to render it.
+    _text_images = {}
+    _text_images_size = 256
 
     def __init__ (self, image=None):
         '''
@@ -72,6 +85,9 @@ class Painter (Sprite):
         # Attributes associate with lines
         self._drawing = False
         self._stepsize = 0.1
+        self._antialias = False
+        self._stroke_ends = weakref.WeakKeyDictionary()
+        self._pending_paths = {}
 
         # Attributes associates with fills
         self._filling = False
@@ -79,6 +95,18 @@ class Painter (Sprite):
         self._fillpoly = None
         self._fill_canvas = None
         self._drawings_over_fill = None
+        self._fill_overlay_rect = None
+        self._fill_points = None
+        self._fill_preview = None
+        self._fill_preview_rect = None
+        self._fill_preview_color = None
+        self._fill_preview_exact = 0
+        self._fill_preview_drawn = 0
+        self._fill_preview_first_dir = None
+        self._fill_preview_last_dir = None
+        self._fill_preview_turning = 0
+        self._fill_preview_total_turning = 0
+        self._fill_commands = None
         self._dirty_canvas = False
 
 
@@ -88,6 +116,10 @@ class Painter (Sprite):
     def step_size (self):
         '''
         The step size between points drawn on a line.
+
+        Lines are drawn as whole segments, so this setting doesn't affect 
+        how they look.  It is only kept so that older programs that set it 
+        still work.
         '''
 
         return self._stepsize
@@ -135,6 +167,20 @@ class Painter (Sprite):
         self._linesize = new_width
 
 
+    @property
+    def antialias (self):
+        '''
+        Whether or not lines are drawn with smooth edges.
+        '''
+
+        return self._antialias
+
+    @antialias.setter
+    def antialias (self, new_setting):
+
+        self._antialias = bool(new_setting)
+
+
     @property
     def drawing (self):
         '''
@@ -172,43 +218,173 @@ class Painter (Sprite):
 
         self._drawing = False
 
+        # The next line starts a new stroke, even if it starts here
+        self._stroke_ends.clear()
+
 
     ### Drawing Methods
 
     # A helper method that draws a line from start to end on the given canvas.
-    def _draw_line (self, start, end, canvas=None):
-        if canvas is None:
+    def _draw_line (self, start, end, canvas=None, over_fill=False):
+        if self._buffer_drawing and canvas is None:
+            self._buffer_path((start, end), over_fill)
+        else:
+            self._draw_path((start, end), canvas, over_fill)
+
+
+    # A helper method that draws a line through all of the given points on 
+    # the given canvas.  If `over_fill` is True, the line is drawn on the
+    # surface that holds the drawings on top of the current fill instead.
+    # The `style` is a tuple of the color, width and antialiasing of the 
+    # line, which are the painter's current settings if not given.
+    def _draw_path (self, points, canvas=None, over_fill=False, style=None):
+        if style is None:
+            style = (self._linecolor_obj, self._linesize, self._antialias)
+        color, width, antialias = style
+
+        # Record the line for screens in retained mode
+        if canvas is None and self._is_recording(over_fill):
+            world_points = [pygame.Vector2(p) for p in points]
+            padding = width / 2
+            box = (min(p.x for p in world_points) - padding, 
+                   min(p.y for p in world_points) - padding,
+                   max(p.x for p in world_points) + padding, 
+                   max(p.y for p in world_points) + padding)
+            self._record("stroke", box, world_points, Color(color), 
+                         width, antialias, over_fill=over_fill)
+
+        # Convert to pygame coordinates
+        points = [to_pygame_coordinates(p) for p in points]
+
+        if over_fill:
+            # Only the area around the path needs to be on the fill overlay
+            padding = width / 2 + 2
+            left = math.floor(min(p.x for p in points) - padding)
+            top = math.floor(min(p.y for p in points) - padding)
+            right = math.ceil(max(p.x for p in points) + padding)
+            bottom = math.ceil(max(p.y for p in points) + padding)
+            overlay = self._get_fill_overlay((left, top, right - left, bottom - top))
+            if overlay is None:
+                return
+            canvases = [overlay]
+            offset = pygame.Vector2(self._fill_overlay_rect.topleft)
+            points = [p - offset for p in points]
+        elif canvas is None:
             canvases = [g.canvas for g in self.groups() if isinstance(g, Screen)]
             if not canvases:
                 raise RuntimeError("Can't draw!  This sprite isn't on a screen!")
+
+            # Save the area of the line for screens that keep a history
+            if self._keeps_history():
+                padding = width / 2 + 2
+                left = math.floor(min(p.x for p in points) - padding)
+                top = math.floor(min(p.y for p in points) - padding)
+                right = math.ceil(max(p.x for p in points) + padding)
+                bottom = math.ceil(max(p.y for p in points) + padding)
+                self._touch_canvases((left, top, right - left, bottom - top))
         else:
             canvases = [canvas]
 
-        # Convert to pygame coordinates
-        start = to_pygame_coordinates(start)
-        end = to_pygame_coordinates(end)
+        # Draw the line as a stroke on each canvas.  If the last line drawn on
+        # a canvas ended here with the same style, its round end already 
+        # covers the start of this line.
+        for canvas in canvases:
+            start_cap = self._stroke_ends.get(canvas) != (points[0], style)
+            pgputils.draw_stroke(canvas, color, points, width, antialias, start_cap)
+            self._stroke_ends[canvas] = (points[-1], style)
 
-        # If width is 1, use the pygame function
-        if self._linesize == 1:
-            for canvas in canvases:
-                pygame.draw.line(canvas, self._linecolor_obj, start, end)
 
-        # Otherwise use dots instead
-        else:
-            # Find geometric properties of the line
-            delta = end - start
-            distance, direction = delta.as_polar()
-
-            # Draw dots every 0.1 pixels along the line between the points
-            radius = self._linesize / 2
-            current = start
-            delta = pygame.Vector2(self._stepsize, 0).rotate(direction)
-            for _ in range(int(distance / self._stepsize) + 1):
-                for canvas in canvases:
-                    pygame.draw.circle(canvas, self._linecolor_obj, current, radius)
-                current += delta
+    # A hidden method that adds a path to the lines that are waiting to be 
+    # drawn.  A path that continues the waiting line with the same style is 
+    # joined to it so that they can be drawn all at once.
+    def _buffer_path (self, points, over_fill=False):
+        screens = [g for g in self.groups() if isinstance(g, Screen)]
+        if not screens:
+            raise RuntimeError("Can't draw!  This sprite isn't on a screen!")
+
+        # If the path doesn't continue the waiting line, draw that line first
+        pending = self._pending_paths.get(over_fill)
+        if pending is not None:
+            style, path = pending
+            if (path[-1] != points[0] or 
+                    style != (self._linecolor_obj, self._linesize, self._antialias)):
+                self._flush_paths(over_fill)
+                pending = None
+
+        # Start a new line and let the screens know that it needs to be drawn
+        if pending is None:
+            style = (Color(self._linecolor_obj), self._linesize, self._antialias)
+            pending = self._pending_paths[over_fill] = (style, [pygame.Vector2(points[0])])
+            for screen in screens:
+                screen._add_pending_painter(self)
+
+        pending[1].extend([pygame.Vector2(p) for p in points[1:]])
+
+
+    # A hidden method that draws the lines that are waiting to be drawn.  If
+    # `over_fill` is given, only that line is drawn.
+    def _flush_paths (self, over_fill=None):
+        for key in ((False, True) if over_fill is None else (over_fill,)):
+            pending = self._pending_paths.pop(key, None)
+            if pending is not None:
+                style, path = pending
+                self._draw_path(path, over_fill=key, style=style)
                 
     
+    # A hidden method that returns whether or not drawings need to be 
+    # recorded for any screens in retained mode.  If `over_fill` is True, 
+    # this checks if drawings on top of the current fill need to be recorded.
+    def _is_recording (self, over_fill=False):
+        if over_fill:
+            return self._fill_commands is not None
+        for group in self.groups():
+            if isinstance(group, Screen) and group._display_list is not None:
+                return True
+        return False
+
+
+    # A hidden method that records a drawing command for the screens in 
+    # retained mode.  Commands for drawings on top of a fill are kept until
+    # the fill is drawn.
+    def _record (self, kind, box, *data, over_fill=False):
+        if over_fill:
+            if self._fill_commands is not None:
+                self._fill_commands.append((kind, box) + data)
+        else:
+            for group in self.groups():
+                if isinstance(group, Screen):
+                    group._record(kind, box, *data)
+
+
+    # A hidden method that returns whether or not any of the screens are
+    # keeping a history of their canvas.
+    def _keeps_history (self):
+        for group in self.groups():
+            if isinstance(group, Screen) and group._history is not None:
+                return True
+        return False
+
+
+    # A hidden method that tells the screens that a rect of their canvas (in
+    # pygame coordinates) is about to be drawn on so that it can be saved in
+    # their history.
+    def _touch_canvases (self, rect):
+        for group in self.groups():
+            if isinstance(group, Screen):
+                group._touch_canvas(rect)
+
+
+    # A hidden method that records a picture drawn on the canvas at the 
+    # given rect (in pygame coordinates).  A copy of the picture is kept, 
+    # since the sprite's image can change after it is drawn.
+    def _record_image (self, image, rect, over_fill=False):
+        if self._is_recording(over_fill):
+            left, top = from_pygame_coordinates(rect.topleft)
+            right, bottom = from_pygame_coordinates(rect.bottomright)
+            self._record("image", (left, bottom, right, top), image.copy(), 
+                         (left, top), over_fill=over_fill)
+
+
     # This will replace the position setter.  It makes it so that, if
     # drawing or filling is on, that stuff is drawn to the screen's canvas
     def _set_position (self, new_position):
@@ -222,7 +398,7 @@ class Painter (Sprite):
         # to be drawn on top of the fill.
         if self._filling:
             self._fillpoly.append(self._pos)
-            self._draw_line(start, self._pos, self._drawings_over_fill)
+            self._draw_line(start, self._pos, over_fill=True)
 
         # Draw the line
         if self._drawing:
@@ -246,6 +422,11 @@ class Painter (Sprite):
         setting the `turn` argument to `False`.
         '''
 
+        # If the moves aren't animated, draw the whole path at once
+        if self._batches_paths():
+            self._walk_path_batched(self._flatten_path(path), turn, reverse)
+            return
+
         # Call .go_to() on each point in the path
         for point in path:
             if isinstance(point, list):
@@ -254,10 +435,74 @@ class Painter (Sprite):
                 self.go_to(point, turn=turn, reverse=reverse)
 
 
+    # A hidden method that returns whether or not paths can be drawn all at
+    # once.  This is overridden by sub-classes that animate their moves.
+    def _batches_paths (self):
+        return True
+
+
+    # A hidden method that returns the position and direction that the next
+    # move will start from.  This is overridden by sub-classes that queue 
+    # their moves.
+    def _queue_end (self):
+        return pygame.Vector2(self._pos), self._dir
+
+
+    # A hidden method that turns a path with nested lists into a flat list
+    # of points.
+    def _flatten_path (self, path, points=None):
+        if points is None:
+            points = []
+        for point in path:
+            if isinstance(point, list):
+                self._flatten_path(point, points)
+            else:
+                points.append(pygame.Vector2(point))
+        return points
+
+
+    # A hidden method that moves along a whole path and draws it using as 
+    # few draw calls as possible.
+    def _walk_path_batched (self, points, turn=True, reverse=False):
+        if not points:
+            return
+        path = [self._pos] + points
+
+        # Turn in the direction of the last part of the path that moves
+        if turn:
+            for start, end in zip(path[-2::-1], path[:0:-1]):
+                if start != end:
+                    self.turn_to((end - start).as_polar()[1], reverse=reverse)
+                    break
+
+        # If the turtle is currently creating a filled shape, add the points 
+        # to the filled polygon and draw the path on the upper layer.
+        if self._filling:
+            self._fillpoly.extend(points)
+            if self._buffer_drawing:
+                self._buffer_path(path, over_fill=True)
+            else:
+                self._draw_path(path, over_fill=True)
+
+        # Draw the path
+        if self._drawing:
+            if self._buffer_drawing:
+                self._buffer_path(path)
+            else:
+                self._draw_path(path)
+
+        # Move to the end of the path
+        Sprite.position.fset(self, points[-1])
+        self._dirty_canvas = True
+
+
     ### Creating Filled Shapes
 
     # A helper method that draws the current filled polygon on the given canvas.
     def _draw_fill (self, canvas=None):
+        self._flush_paths()
+        recording = canvas is None and self._is_recording()
+        recording_history = canvas is None and self._keeps_history()
         if canvas is None:
             canvases = [g.canvas for g in self.groups() if isinstance(g, Screen)]
             if not canvases:
@@ -265,15 +510,196 @@ class Painter (Sprite):
         else:
             canvases = [canvas]
 
+        # Save the area of the fill for screens that keep a history
+        points = self._get_fill_points()
+        if recording_history and points:
+            left = math.floor(min(p.x for p in points)) - 1
+            top = math.floor(min(p.y for p in points)) - 1
+            right = math.ceil(max(p.x for p in points)) + 2
+            bottom = math.ceil(max(p.y for p in points)) + 2
+            self._touch_canvases((left, top, right - left, bottom - top))
+            if self._drawings_over_fill is not None:
+                self._touch_canvases(self._fill_overlay_rect)
+
         # Draw the points to the canvas
-        points = [to_pygame_coordinates(p) for p in self._fillpoly]
         if len(points) >= 3:
             for canvas in canvases:
                 pygame.draw.polygon(canvas, self._fillcolor, points)
 
         # Draw the lines back on top of the canvas
-        for canvas in canvases:
-            canvas.blit(self._drawings_over_fill, (0, 0))
+        if self._drawings_over_fill is not None:
+            for canvas in canvases:
+                canvas.blit(self._drawings_over_fill, self._fill_overlay_rect)
+
+        # Record the fill and the drawings on top of it for screens in 
+        # retained mode
+        if recording:
+            if len(self._fillpoly) >= 3:
+                world_points = [pygame.Vector2(p) for p in self._fillpoly]
+                box = (min(p.x for p in world_points), min(p.y for p in world_points),
+                       max(p.x for p in world_points), max(p.y for p in world_points))
+                self._record("polygon", box, world_points, Color(self._fillcolor_obj))
+            for command in self._fill_commands or ():
+                self._record(*command)
+
+
+    # A hidden method that returns the points of the current filled polygon 
+    # in pygame coordinates.  Points are only ever added to the polygon, so
+    # only the new points need to be converted.
+    def _get_fill_points (self):
+        points = self._fill_points
+        for point in self._fillpoly[len(points):]:
+            points.append(to_pygame_coordinates(point))
+        return points
+
+
+    # A helper method that draws a preview of the incomplete fill on the given
+    # surface.  The polygon is drawn on a surface that is kept between frames.
+    # While the polygon is convex, new points only add a triangle from the 
+    # first point to the preview, and the whole polygon is only drawn again 
+    # once enough points have been added, so the cost of each frame doesn't 
+    # grow with the polygon.  Other polygons are drawn again every time, 
+    # since the triangles would fill the wrong area.
+    def _draw_fill_preview (self, surface):
+        self._flush_paths(True)
+        points = self._get_fill_points()
+        if len(points) < 3:
+            self._fill_preview = None
+        else:
+            preview = self._fill_preview
+            rect = self._fill_preview_rect
+            new_points = points[self._fill_preview_drawn:]
+
+            # Draw the whole polygon if there is no preview yet, the fill 
+            # color changed, the new points are outside of the preview or
+            # enough points have been added since it was last drawn.
+            if (preview is None or self._fill_preview_color != self._fillcolor_obj or
+                    not all(rect.collidepoint(p) for p in new_points) or
+                    len(points) - self._fill_preview_exact > max(16, len(points) // 8)):
+                self._render_fill_preview(points, surface.get_rect())
+
+            # Otherwise, just add the triangles to the new points if the 
+            # polygon is still convex
+            else:
+                self._add_fill_turns(points, self._fill_preview_drawn)
+                if self._fill_is_convex(points):
+                    offset = pygame.Vector2(rect.topleft)
+                    first = points[0] - offset
+                    for i in range(self._fill_preview_drawn, len(points)):
+                        triangle = (first, points[i - 1] - offset, points[i] - offset)
+                        pygame.draw.polygon(preview, self._fillcolor_obj, triangle)
+                    self._fill_preview_drawn = len(points)
+                else:
+                    self._render_fill_preview(points, surface.get_rect())
+
+        # Draw the polygon and the lines on top of it
+        if self._fill_preview is not None:
+            surface.blit(self._fill_preview, self._fill_preview_rect)
+        if self._drawings_over_fill is not None:
+            surface.blit(self._drawings_over_fill, self._fill_overlay_rect)
+
+
+    # A hidden method that draws the whole polygon for the fill preview.  The
+    # preview surface has some room to grow, but doesn't extend past the 
+    # given bounds.
+    def _render_fill_preview (self, points, bounds):
+        left = math.floor(min(p.x for p in points))
+        top = math.floor(min(p.y for p in points))
+        right = math.ceil(max(p.x for p in points))
+        bottom = math.ceil(max(p.y for p in points))
+        rect = pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+        rect = rect.inflate(128, 128).clip(bounds)
+
+        preview = pygame.Surface(rect.size, pygame.SRCALPHA)
+        offset = pygame.Vector2(rect.topleft)
+        pygame.draw.polygon(preview, self._fillcolor_obj, 
+                            [p - offset for p in points])
+
+        self._fill_preview = preview
+        self._fill_preview_rect = rect
+        self._fill_preview_color = pygame.Color(self._fillcolor_obj)
+        self._fill_preview_exact = len(points)
+        self._fill_preview_drawn = len(points)
+
+        # Find how the path turns so that new points can be checked
+        self._fill_preview_first_dir = None
+        self._fill_preview_last_dir = None
+        self._fill_preview_turning = 0
+        self._fill_preview_total_turning = 0
+        self._add_fill_turns(points, 0)
+
+
+    # A hidden method that adds how much the path of the fill polygon turns
+    # at the points from index `start` on.  Both the turning and the total 
+    # size of the turns (in degrees) are kept.
+    def _add_fill_turns (self, points, start):
+        for i in range(max(start, 1), len(points)):
+            direction = points[i] - points[i - 1]
+            if direction.x == 0 and direction.y == 0:
+                continue
+            if self._fill_preview_last_dir is None:
+                self._fill_preview_first_dir = direction
+            else:
+                turn = _turn_angle(self._fill_preview_last_dir, direction)
+                self._fill_preview_turning += turn
+                self._fill_preview_total_turning += abs(turn)
+            self._fill_preview_last_dir = direction
+
+
+    # A hidden method that returns whether or not the fill polygon is convex.
+    # It is if all of its turns, including the two where it closes back to 
+    # the first point, are in the same direction and add up to one full turn.
+    def _fill_is_convex (self, points):
+        turning = self._fill_preview_turning
+        total_turning = self._fill_preview_total_turning
+        if self._fill_preview_last_dir is None:
+            return True
+        directions = [self._fill_preview_last_dir, points[0] - points[-1],
+                      self._fill_preview_first_dir]
+        directions = [d for d in directions if d.x != 0 or d.y != 0]
+        for i in range(1, len(directions)):
+            turn = _turn_angle(directions[i - 1], directions[i])
+            turning += turn
+            total_turning += abs(turn)
+        return (abs(abs(turning) - total_turning) < 0.001 and 
+                total_turning < 360.001)
+
+
+    # A hidden method that returns the surface that holds the drawings made 
+    # on top of the current fill, making sure that it covers the given 
+    # rectangle (in pygame coordinates).  The surface starts out empty and 
+    # only grows when something is drawn outside of it, so small fills only 
+    # need small surfaces.  If the rectangle is completely off of the 
+    # canvases, None is returned.
+    def _get_fill_overlay (self, rect):
+
+        # Nothing outside of the canvases needs to be kept
+        bounds = pygame.Rect(0, 0, 1, 1)
+        bounds.unionall_ip([g.canvas.get_rect() for g in self.groups() 
+                            if isinstance(g, Screen)])
+        rect = pygame.Rect(rect).clip(bounds)
+        if rect.width == 0 or rect.height == 0:
+            return None
+
+        # If the current surface is big enough, use it
+        old_overlay = self._drawings_over_fill
+        old_rect = self._fill_overlay_rect
+        if old_overlay is not None and old_rect.contains(rect):
+            return old_overlay
+
+        # Otherwise, make a bigger surface with some room to grow and copy 
+        # the old drawings onto it
+        new_rect = rect.inflate(128, 128).clip(bounds)
+        if old_overlay is not None:
+            new_rect.union_ip(old_rect)
+        new_overlay = pygame.Surface(new_rect.size, pygame.SRCALPHA)
+        if old_overlay is not None:
+            new_overlay.blit(old_overlay, (old_rect.x - new_rect.x, 
+                                           old_rect.y - new_rect.y))
+
+        self._drawings_over_fill = new_overlay
+        self._fill_overlay_rect = new_rect
+        return new_overlay
 
 
     @property
@@ -328,15 +754,16 @@ class Painter (Sprite):
         self._filling = True
         self._fillpoly = [self._pos]
 
-        # Create a surface to hold the lines drawn on top of the fill
-        canvases = [g.canvas for g in self.groups() if isinstance(g, Screen)]
-        if canvases:
-            width = max([c.get_width() for c in canvases])
-            height = max([c.get_height() for c in canvases])
-        else:
-            width = 1
-            height = 1
-        self._drawings_over_fill = pygame.Surface((width, height), pygame.SRCALPHA)
+        # The surface that holds the lines drawn on top of the fill is only 
+        # created when something is drawn
+        self._drawings_over_fill = None
+        self._fill_overlay_rect = None
+        self._fill_points = []
+        self._fill_preview = None
+
+        # Drawings on top of the fill only need to be recorded for screens in
+        # retained mode
+        self._fill_commands = [] if self._is_recording() else None
 
 
     def end_fill (self):
@@ -358,6 +785,11 @@ class Painter (Sprite):
         # Reset the filling attributes
         self._filling = False
         self._fillpoly = None
+        self._drawings_over_fill = None
+        self._fill_overlay_rect = None
+        self._fill_points = None
+        self._fill_preview = None
+        self._fill_commands = None
         self._dirty_canvas = True
 
 
@@ -378,6 +810,9 @@ class Painter (Sprite):
         if not canvases:
             raise RuntimeError("Can't draw!  This sprite isn't on a screen!")
 
+        # Draw any lines that are waiting first
+        self._flush_paths()
+
         # If no size is given, make the dot a bit bigger than the line size
         if size is None:
             size = max(self._linesize + 4, 2 * self._linesize)
@@ -388,13 +823,27 @@ class Painter (Sprite):
 
         # Draw the dot
         point = to_pygame_coordinates(self._pos)
+        rect = pygame.Rect(0, 0, math.ceil(size) + 2, math.ceil(size) + 2)
+        rect.center = round(point.x), round(point.y)
+        self._touch_canvases(rect)
         for canvas in canvases:
             pygame.draw.circle(canvas, color, point, size / 2)
 
+        # Record the dot for screens in retained mode
+        center = pygame.Vector2(self._pos)
+        box = (center.x - size / 2, center.y - size / 2, 
+               center.x + size / 2, center.y + size / 2)
+        if self._is_recording():
+            self._record("dot", box, center, size, Color(color))
+
         # If the turtle is currently creating a filled shape, draw the dot on 
         # the upper layer to be drawn on top of the fill.
         if self._filling:
-            pygame.draw.circle(self._drawings_over_fill, color, point, size / 2)
+            self._record("dot", box, center, size, Color(color), over_fill=True)
+            overlay = self._get_fill_overlay(rect)
+            if overlay is not None:
+                offset = pygame.Vector2(self._fill_overlay_rect.topleft)
+                pygame.draw.circle(overlay, color, point - offset, size / 2)
 
         self._dirty_canvas = True
 
@@ -410,7 +859,10 @@ class Painter (Sprite):
         `extent` is negative, draw the circle clockwise.
 
         The circle will actually be an approximation.  The turtle will really
-        draw a regular polygon with 360 sides.
+        draw a regular polygon with just enough sides that it is within a
+        quarter of a pixel of a real circle (or a bit more for thick lines).
+        If the painter isn't animated, then circles and thin arcs are drawn
+        as real circles.
         '''
 
         # Because the circle is an approximation, we will calculate the
@@ -453,25 +905,154 @@ class Painter (Sprite):
         if extent == 0:
             raise ValueError("You can't make an arc with subtended angle of 0 degrees!")
 
-        if radius > 0:
-            if extent > 0:
-                steps = list(range(1, int(extent)))
-            else:
-                steps = list(range(-1, int(extent), -1))
-            steps.append(extent)
+        # Clockwise circles turn the other way
+        sign = 1 if radius > 0 else -1
+
+        # Find the number of sides needed so that the polygon is never more
+        # than the tolerance away from the circle.  Never use more than one 
+        # side per degree.
+        tolerance = max(0.25, self._linesize / 8)
+        ratio = min(1, tolerance / abs(radius))
+        side_angle = min(30, max(1, 2 * math.degrees(math.acos(1 - ratio))))
+        sides = max(1, math.ceil(abs(extent) / side_angle))
+
+        start, start_dir = self._queue_end()
+        center = start + pygame.Vector2(0, radius).rotate(start_dir)
+        path = [center + pygame.Vector2(0, -radius).rotate(start_dir + sign * extent * i / sides) 
+                for i in range(1, sides + 1)]
+        end_dir = (start_dir + sign * extent) % 360
+
+        # If the painter isn't animated, draw whole circles and thin arcs 
+        # directly and then move along the path without drawing it.
+        if (self._drawing and self._batches_paths() and not self._antialias and
+                (abs(extent) >= 360 or self._linesize == 1)):
+            self._draw_arc(center, radius, sign * extent)
+            self._drawing = False
+            try:
+                self.walk_path(path, reverse=extent < 0)
+            finally:
+                self._drawing = True
         else:
-            if extent > 0:
-                steps = list(range(-1, int(-extent), -1))
-            else:
-                steps = list(range(1, int(-extent)))
-            steps.append(-extent)
+            self.walk_path(path, reverse=extent < 0)
+        self.turn_to(end_dir)
 
-        center = self._pos + pygame.Vector2(0, radius).rotate(self._dir)
-        path = [center + pygame.Vector2(0, -radius).rotate(self._dir + step) for step in steps]
-        end_dir = (self._dir + extent) % 360
 
-        self.walk_path(path, reverse=extent < 0)
-        self._dir = end_dir
+    # A hidden method that draws an arc around the given center, starting at
+    # the current position, and going counterclockwise by `angle` degrees.
+    def _draw_arc (self, center, radius, angle):
+        canvases = [g.canvas for g in self.groups() if isinstance(g, Screen)]
+        if not canvases:
+            raise RuntimeError("Can't draw!  This sprite isn't on a screen!")
+
+        # Draw any lines that are waiting first
+        self._flush_paths()
+
+        pygame_center = to_pygame_coordinates(center)
+        start_angle = (self._pos - center).as_polar()[1]
+        size = math.ceil(abs(radius) + self._linesize / 2) + 2
+        self._touch_canvases((pygame_center.x - size, pygame_center.y - size, 
+                              2 * size, 2 * size))
+        for canvas in canvases:
+            pgputils.draw_arc(canvas, self._linecolor_obj, pygame_center, radius,
+                              start_angle, angle, self._linesize)
+
+        # Record the arc for screens in retained mode
+        if self._is_recording():
+            size = abs(radius) + self._linesize / 2
+            box = (center.x - size, center.y - size, center.x + size, center.y + size)
+            self._record("arc", box, pygame.Vector2(center), radius, start_angle, 
+                         angle, Color(self._linecolor_obj), self._linesize)
+
+
+    ### Fill an area
+
+    def flood_fill (self, color=None, tolerance=0):
+        '''
+        Fill the area of the canvas around the current position that is the
+        same color, like the paint bucket in a drawing program.
+
+        The `tolerance` is how different (from 0 to 255) each part of a 
+        pixel's color can be from the color at the current position and 
+        still be filled.
+
+        If the `color` is not specified, the fill color is used.
+        '''
+
+        canvases = [g.canvas for g in self.groups() if isinstance(g, Screen)]
+        if not canvases:
+            raise RuntimeError("Can't draw!  This sprite isn't on a screen!")
+
+        # Draw any lines that are waiting first
+        self._flush_paths()
+
+        # Ensure that the tolerance is a number from 0 to 255
+        try:
+            tolerance = float(tolerance)
+        except:
+            raise ValueError("The tolerance must be a number!") from None
+        if not 0 <= tolerance <= 255:
+            raise ValueError("The tolerance must be between 0 and 255!")
+
+        # If no color is given use the fill color
+        if color is None:
+            color = self._fillcolor_obj
+        color = Color(color)
+
+        point = to_pygame_coordinates(self._pos)
+        seed = (math.floor(point.x), math.floor(point.y))
+        for group in self.groups():
+            if not isinstance(group, Screen):
+                continue
+            canvas = group.canvas
+            if not canvas.get_rect().collidepoint(seed):
+                continue
+
+            # Find the pixels that are close to the color at the position and
+            # connected to it
+            area = self._flood_fill_area(canvas, seed, math.floor(tolerance))
+
+            # Save the area for the history and record it in retained mode
+            if group._history is not None or group._display_list is not None:
+                rects = area.get_bounding_rects()
+                if not rects:
+                    continue
+                rect = rects[0].unionall(rects[1:])
+                group._touch_canvas(rect)
+                if group._display_list is not None:
+                    image = area.to_surface(setcolor=color, unsetcolor=None)
+                    image = image.subsurface(rect).copy()
+                    left, top = group.from_pygame_coordinates(rect.topleft)
+                    right, bottom = group.from_pygame_coordinates(rect.bottomright)
+                    group._record("image", (left, bottom, right, top), image, (left, top))
+
+            # Draw the color on those pixels
+            area.to_surface(canvas, setcolor=color, unsetcolor=None)
+
+        self._dirty_canvas = True
+
+
+    # A hidden method that returns a mask of the pixels of the canvas that are
+    # connected to the seed pixel and within the tolerance of its color.
+    def _flood_fill_area (self, canvas, seed, tolerance):
+        target = canvas.get_at(seed)
+
+        # Find the pixels with a close enough opacity.  If the pixel is (almost)
+        # transparent, then its red, green and blue don't matter.
+        if target.a - tolerance > 0:
+            mask = pygame.mask.from_surface(canvas, target.a - tolerance - 1)
+        else:
+            mask = pygame.mask.Mask(canvas.get_size(), fill=True)
+        if target.a + tolerance < 255:
+            mask.erase(pygame.mask.from_surface(canvas, target.a + tolerance), (0, 0))
+
+        # Find the pixels with close enough red, green and blue
+        if target.a > tolerance:
+            threshold = (tolerance + 1, tolerance + 1, tolerance + 1, 255)
+            color_mask = pygame.mask.from_threshold(canvas, target, threshold)
+            mask = mask.overlap_mask(color_mask, (0, 0))
+
+        return mask.connected_component(seed)
+
 
     ### Draw a stamp
 
@@ -484,15 +1065,24 @@ class Painter (Sprite):
         if not canvases:
             raise RuntimeError("Can't draw!  This sprite isn't on a screen!")
 
+        # Draw any lines that are waiting first
+        self._flush_paths()
+
         # Copy the image to the canvas
         self._clean_image()
+        self._touch_canvases(self.rect)
         for canvas in canvases:
             canvas.blit(self.image, self.rect)
+        self._record_image(self.image, self.rect)
 
         # If the turtle is currently creating a filled shape, stamp the image on 
         # the upper layer to be drawn on top of the fill.
         if self._filling:
-            self._drawings_over_fill.blit(self.image, self.rect)
+            overlay = self._get_fill_overlay(self.rect)
+            if overlay is not None:
+                overlay.blit(self.image, self.rect.move(-self._fill_overlay_rect.x,
+                                                        -self._fill_overlay_rect.y))
+            self._record_image(self.image, self.rect, over_fill=True)
 
         self._dirty_canvas
 
@@ -500,7 +1090,7 @@ class Painter (Sprite):
     ### Write on the screen
 
     def write (self, text, align="middle center", font="Arial", 
-            size=12, style=None, color=None):
+            size=12, style=None, color=None, antialias=True):
         '''
         Write text to the screen at the turtle's current location using the pen.
 
@@ -518,46 +1108,56 @@ class Painter (Sprite):
         combination separated by space (e.g. "bold italic").
 
         If the `color` is not specified, the line color is used.
-        '''
 
-        # If font is a Font object, just use that
-        if isinstance(font, pygame.font.Font):
-            font_obj = font
+        If `antialias` is `False`, the edges of the text will not be smoothed.
 
-        # If this font and size have been used before, check the _fonts cache
-        elif (font, size) in Painter._fonts:
-            font_obj = Painter._fonts[font, size]
+        Writing the same text with the same settings again is fast, so this
+        can be used to write scores or timers on every frame.
+        '''
 
-        # Otherwise, the font needs to be a string
+        # Get the styles
+        if style is None:
+            style = ()
         else:
-            font = str(font)
-
-            # If the font ends in ".ttf", then load the font from the file
-            if font.endswith(".ttf"):
-                font_obj = pygame.font.Font(font, size)
-
-            # Otherwise, use a system font
-            else:
-                font_obj = pygame.font.SysFont(font, size)
-
-            # Add the font to the _fonts cache
-            Painter._fonts[font, size] = font_obj
-
-        # Apply the styles
-        if style is not None:
             if isinstance(style, str):
                 style = style.split()
-            style = [s.lower() for s in style]
-            font_obj.set_bold("bold" in style)
-            font_obj.set_italic("italic" in style)
-            font_obj.set_underline("underline" in style)
+            style = tuple(sorted({s.lower() for s in style}))
+
+        # If font is a Font object, just use that and apply the style while
+        # rendering.  Otherwise, get the font with the style already applied
+        # from the font registry.
+        if isinstance(font, pygame.font.Font):
+            font_obj = font
+        else:
+            font_obj = font_registry.get_font(str(font), size, style)
+            style = ()
 
         # Get the color
         if color is None:
             color = self._linecolor
+        color = tuple(pygame.Color(color))
+
+        # Get an image of the text from the cache or render it.  The cache 
+        # uses what the font was loaded from and the style that the text is
+        # drawn with, so that it doesn't keep Font objects alive.
+        text = str(text)
+        antialias = bool(antialias)
+        if style:
+            flags = ("bold" in style, "italic" in style, "underline" in style)
+        else:
+            flags = (font_obj.get_bold(), font_obj.get_italic(), 
+                     font_obj.get_underline())
+        key = (text, font_registry._font_identity(font_obj), flags, color, 
+               antialias)
+        image = Painter._text_images.pop(key, None)
+        if image is None:
+            image = self._render_text(font_obj, text, style, color, antialias)
+
+        # Keep the most recently used images in the cache
+        Painter._text_images[key] = image
+        while len(Painter._text_images) > Painter._text_images_size:
+            Painter._text_images.pop(next(iter(Painter._text_images)))
 
-        # Render an image of the text
-        image = font_obj.render(str(text), True, color)
         rect = image.get_rect()
 
         # Set the position of the text from the align parameter
@@ -585,9 +1185,12 @@ class Painter (Sprite):
         canvases = [g.canvas for g in self.groups() if isinstance(g, Screen)]
         if not canvases:
             raise RuntimeError("Can't draw!  This sprite isn't on a screen!")
+        self._flush_paths()
 
+        self._touch_canvases(rect)
         for canvas in canvases:
             canvas.blit(image, rect)
+        self._record_image(image, rect)
             
         self._dirty_canvas = True
 
@@ -595,6 +1198,26 @@ class Painter (Sprite):
         return font_obj
 
 
+    # A hidden method that renders an image of the text.  If a Font object 
+    # was given to write() with a style, the style is only applied while 
+    # rendering so that the font isn't changed.
+    def _render_text (self, font_obj, text, style, color, antialias):
+        if not style:
+            return font_obj.render(text, antialias, color)
+
+        old_style = (font_obj.get_bold(), font_obj.get_italic(), 
+                     font_obj.get_underline())
+        try:
+            font_obj.set_bold("bold" in style)
+            font_obj.set_italic("italic" in style)
+            font_obj.set_underline("underline" in style)
+            return font_obj.render(text, antialias, color)
+        finally:
+            font_obj.set_bold(old_style[0])
+            font_obj.set_italic(old_style[1])
+            font_obj.set_underline(old_style[2])
+
+
     ### Override the Sprite update() method
 
     def update (self, screen=None):
@@ -612,7 +1235,7 @@ class Painter (Sprite):
             screen = get_active_screen()
         if (screen is not None and self in screen and self._filling and
                 self._fill_as_moving):
-            self._draw_fill(screen._update_drawings)
+            self._draw_fill_preview(screen._update_drawings)
 
         self._dirty_canvas = False
 
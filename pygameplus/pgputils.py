@@ -20,7 +20,11 @@
 
 import inspect
 import math
+import types
+import weakref
+
 import pygame
+import pygame.gfxdraw
 
 # The provided collision detection functions that are used in the "touching"
 # methods.
@@ -50,7 +54,8 @@ mouse_button_reverse_map = {
 # Flips a polygon
 def flip_polygon (polygon, x_flip, y_flip):
     def flip_point (point):
-        return point.reflect(pygame.Vector2(bool(y_flip), bool(x_flip)))
+        return pygame.Vector2(-point.x if x_flip else point.x,
+                              -point.y if y_flip else point.y)
     return tuple([flip_point(p) for p in polygon])
 
 # Takes a polygon and draws it on a fitted pygame.Surface
@@ -64,6 +69,69 @@ def polygon_to_surface (polygon, line_color, fill_color=None, width=1):
     pygame.draw.polygon(surface, line_color, pygame_points, width)
     return surface
 
+# Draws a thick line through the given points (in pygame coordinates).  Each
+# segment is drawn as a single quad and a circle is drawn at each point for
+# round caps and joins.  If `start_cap` is False, the circle at the first
+# point is skipped because it was already drawn.
+def draw_stroke (surface, color, points, width, antialias=False, start_cap=True):
+    radius = width / 2
+
+    # Thin lines can be drawn directly
+    if width <= 1:
+        if len(points) == 1:
+            surface.set_at([round(c) for c in points[0]], color)
+        elif antialias:
+            pygame.draw.aalines(surface, color, False, points)
+        else:
+            pygame.draw.lines(surface, color, False, points)
+        return
+
+    # Draw a round cap at the start
+    if start_cap:
+        draw_round_cap(surface, color, points[0], radius, antialias)
+
+    # Draw a quad for each segment and a round join/cap at its end
+    for start, end in zip(points, points[1:]):
+        delta = pygame.Vector2(end) - start
+        if delta.length_squared() > 1e-9:
+            normal = pygame.Vector2(-delta.y, delta.x)
+            normal.scale_to_length(radius)
+            quad = (start + normal, end + normal, end - normal, start - normal)
+            pygame.draw.polygon(surface, color, quad)
+            if antialias:
+                pygame.draw.aaline(surface, color, quad[0], quad[1])
+                pygame.draw.aaline(surface, color, quad[2], quad[3])
+        draw_round_cap(surface, color, end, radius, antialias)
+
+# Draws a filled circle used for the caps and joins of thick lines
+def draw_round_cap (surface, color, center, radius, antialias=False):
+    if antialias:
+        x, y = round(center[0]), round(center[1])
+        pygame.gfxdraw.aacircle(surface, x, y, round(radius), color)
+        pygame.gfxdraw.filled_circle(surface, x, y, round(radius), color)
+    else:
+        pygame.draw.circle(surface, color, center, radius)
+
+# Draws an arc around the given center (in pygame coordinates).  The arc 
+# starts at `start_angle` and goes counterclockwise by `angle` degrees.  If 
+# the angle is a whole turn, then a ring is drawn.
+def draw_arc (surface, color, center, radius, start_angle, angle, width):
+
+    # Find the box around the circle
+    radius = abs(radius)
+    if width > 1:
+        radius += width / 2
+    rect = pygame.Rect(0, 0, round(2 * radius), round(2 * radius))
+    rect.center = round(center[0]), round(center[1])
+
+    # Draw whole circles as a ring and arcs using the pygame function
+    if abs(angle) >= 360:
+        pygame.draw.circle(surface, color, center, radius, width)
+    else:
+        start = math.radians(start_angle)
+        end = start + math.radians(angle)
+        pygame.draw.arc(surface, color, rect, min(start, end), max(start, end), width)
+
 # The built-in polygon images that can be used for Sprites
 polygon_images = {
     "turtle": ((16, 0), (14, -2), (10, -1), (7, -4), (9, -7), (8, -9), (5, -6), 
@@ -82,32 +150,80 @@ polygon_images = {
 for shape, points in polygon_images.items():
     polygon_images[shape] = tuple(pygame.Vector2(p) for p in points)
 
-# Helper function that is used to call a function with the keyword arguments
-# given
-def call_with_args (func, **args):
-    # Loop through the parameters
-    signature = inspect.signature(func)
-    pos_args = []
-    kw_args = {}
+# The adapters that call functions with only the arguments that they ask
+# for.  Each function's signature is only looked at once, the first time 
+# that it is called.  Bound methods are saved by the function that they come
+# from, since a new bound method is created every time one is looked up.
+_adapters = weakref.WeakKeyDictionary()
+_method_adapters = weakref.WeakKeyDictionary()
+
+# Helper function that creates an adapter for a function signature.  The
+# adapter is a function that takes the function and a dictionary of 
+# arguments and calls the function with the ones it asks for.
+def _make_adapter (signature):
+    pos_names = []
+    kw_names = []
+    var_kw = False
     for name, parameter in signature.parameters.items():
-        # If it's a positional argument, add it to the list
+        # Positional arguments are given or None
         if parameter.kind < 2:
-            pos_args.append(args.get(name, None))
+            pos_names.append(name)
 
-        # If it's a keyword argument, add it to the dictionary if given
+        # Keyword arguments are only given if they are in the arguments
         elif parameter.kind == 3:
-            if name in args:
-                kw_args[name] = args[name]
+            kw_names.append(name)
 
-        # If a ** argument is provided, put all of the arguments given as
-        # keyword arguments
+        # A ** argument gets all of the arguments without their own 
+        # parameter
         elif parameter.kind == 4:
+            var_kw = True
+
+    # Most functions only have positional arguments, so they get simple
+    # adapters
+    if not kw_names and not var_kw:
+        if not pos_names:
+            return lambda func, args: func()
+        if len(pos_names) == 1:
+            name = pos_names[0]
+            return lambda func, args: func(args.get(name))
+        return lambda func, args: func(*map(args.get, pos_names))
+
+    param_names = set(signature.parameters)
+    def adapter (func, args):
+        kw_args = {n: args[n] for n in kw_names if n in args}
+        if var_kw:
             for arg_name, value in args.items():
-                if arg_name not in signature.parameters:
+                if arg_name not in param_names:
                     kw_args[arg_name] = value
+        func(*map(args.get, pos_names), **kw_args)
+    return adapter
 
-    # Call the function
-    func(*pos_args, **kw_args)
+# Helper function that gets the adapter for a function.  Functions that 
+# can't be saved (e.g. built-in functions) get a new adapter every time.
+def _get_adapter (func):
+    if isinstance(func, types.MethodType):
+        cache, key = _method_adapters, func.__func__
+    else:
+        cache, key = _adapters, func
+    try:
+        adapter = cache.get(key)
+    except TypeError:
+        return _make_adapter(inspect.signature(func))
+    if adapter is None:
+        adapter = cache[key] = _make_adapter(inspect.signature(func))
+    return adapter
+
+# Helper function that is used to call a function with the keyword arguments
+# given
+def call_with_args (func, **args):
+    try:
+        if type(func) is types.MethodType:
+            adapter = _method_adapters[func.__func__]
+        else:
+            adapter = _adapters[func]
+    except (KeyError, TypeError):
+        adapter = _get_adapter(func)
+    adapter(func, args)
 
 
 def load_picture (picture):
@@ -22,9 +22,17 @@
 #                               GLOBAL VARIABLES
 ################################################################################
 
+import contextlib
+import math
+import warnings
 import pygame
 
 from . import pgputils
+from .fonts import font_registry
+from .displaylist import DisplayList
+from .history import CanvasHistory
+from .tilemap import TileMap
+from .timers import TimerQueue
 
 ################################################################################
 #                                 SCREEN CLASS
@@ -60,12 +68,25 @@ class Screen (pygame.sprite.LayeredUpdates):
     # Stores the screen that is currently visible on the screen
     _active = None
 
-    def __init__ (self, width, height, title=""):
+    # Caches that are shared by all screens for drawing grids.  Grids are
+    # cached by their size and properties.
+    _grid_cache = {}
+    _grid_cache_size = 8
+    _grid_font = None
+
+    def __init__ (self, width, height, title="", window_size=None, 
+                  fullscreen=False):
         '''
         Create a Screen object.
 
         You must specify the `width` and `height` of the screen.  Optionally, you
         can set the title of the screen.
+
+        The `window_size` can be used to show the screen in a window that is
+        larger (or smaller) than the screen itself.  If `fullscreen` is `True`,
+        the screen will fill the entire display.  In both cases, everything is 
+        drawn at the screen's size and then scaled once to fit the window.
+        See the `window_size` and `scaling` properties for more details.
         '''
 
         pygame.sprite.LayeredUpdates.__init__(self)
@@ -73,6 +94,23 @@ class Screen (pygame.sprite.LayeredUpdates):
         # Stores the pygame surface associated with the screen
         self._surface = None
 
+        # Attributes for the window that the screen is shown in.  If the 
+        # window is not the same size as the screen, then the screen is drawn
+        # on the frame surface which is scaled to the viewport in the window.
+        self._window_size = None
+        self._fullscreen = bool(fullscreen)
+        self._scaling = "integer"
+        self._frame = None
+        self._viewport = None
+
+        # Attributes for keeping the last frame drawn when the screen closes
+        self._retain_frame = False
+        self._last_frame = None
+
+        # The cross-fade from the previous screen as a list of the old image,
+        # the fade time and the time that the fade started
+        self._fade = None
+
         # Attributes for the dimensions, title and background
         self._width = int(width)
         self._height = int(height)
@@ -91,12 +129,47 @@ class Screen (pygame.sprite.LayeredUpdates):
         self._release_funcs = [None for _ in range(5)]
         self._mouse_move_func = None
 
+        # Changes every time an event handler is added or removed so that the
+        # game loop knows when to look at the handlers again
+        self._handler_version = 0
+
         # The pygame surface that holds any drawing added to the screen
         self._canvas = pygame.Surface((width, height), pygame.SRCALPHA)
         self._update_drawings = None
 
-        # Attribute to hold timer event handlers
-        self._timers = {}
+        # The list of drawing commands that is kept in retained mode
+        self._display_list = None
+
+        # The undo history of the canvas
+        self._history = None
+
+        # The tile maps drawn on the screen as a list of (layer, tile map)
+        # pairs sorted by layer.  They are kept out of the sprites so that
+        # code that works with sprites doesn't see them.
+        self._tile_maps = []
+
+        # The painters with lines that are waiting to be drawn on the canvas
+        self._pending_painters = []
+
+        # How far (from 0 to 1) the sprites are drawn between their previous
+        # and current positions.  This is only used by the game loop when it
+        # updates at a fixed rate.
+        self._interpolation = None
+
+        # Attributes that control how often turtles redraw the screen when
+        # the game loop isn't running
+        self._tracer_n = 1
+        self._tracer_delay = 0
+        self._tracer_count = 0
+        self._tracer_last = 0
+
+        # The timers that are run while the screen is active.  They are 
+        # paused until the screen is opened.
+        self._timers = TimerQueue()
+        self._timers.pause()
+
+        # The camera that determines which part of the world is visible
+        self._camera = Camera(self)
 
         # Attributes that hold information about the screen's grid
         self._show_grid = False
@@ -113,39 +186,206 @@ class Screen (pygame.sprite.LayeredUpdates):
             "minor_opacity": None,  # 50% of opacity
             "minor_thickness": None   #50% of thickness
         }
-        self._create_grid()
+
+        # Validate the window size
+        self.window_size = window_size
 
 
     ### Screen Visibility Methods
 
-    def open (self):
+    def open (self, fade=0):
         '''
         Make this screen the active, visible screen in the window.
+
+        If a `fade` time (in milliseconds) is given, then the previously
+        active screen will cross-fade into this one.  The fade is drawn by 
+        the game loop, so this screen keeps updating and handling events 
+        while it fades in.
         '''
 
-        # Call the close method for any other open screen
-        if Screen._active is not None and Screen._active != self:
-            self._active._close()
+        # Call the close method for any other open screen.  If fading, keep
+        # a copy of what that screen looked like.
+        previous = Screen._active
+        old_image = None
+        if previous is not None and previous != self:
+            if fade > 0:
+                old_image = previous._copy_frame()
+            previous._close()
 
         # Create a new pygame screen surface in the window
-        self._surface = pygame.display.set_mode((self._width, self._height))
+        self._set_mode()
         pygame.display.set_caption(self._title)
 
-        # Set this as the active screen
+        # Set this as the active screen and start its timers
         Screen._active = self
+        self._timers.resume()
+
+        # Start fading from the old screen.  The first frame only shows the
+        # old screen and the game loop draws the rest of the fade.
+        if old_image is not None:
+            target = self._surface if self._frame is None else self._frame
+            if old_image.get_size() != target.get_size():
+                old_image = pygame.transform.scale(old_image, target.get_size())
+            self._fade = [old_image, fade, pygame.time.get_ticks()]
+            self.draw()
+            pygame.display.flip()
+
+        # If this screen kept its last frame, show it until the game loop 
+        # draws the next frame
+        elif self._last_frame is not None:
+            self._show_image(self._last_frame)
+
+        # Otherwise, draw the screen
+        else:
+            self.redraw()
+
+
+    # A hidden method that returns a copy of what is currently shown on this
+    # screen (before it is scaled to the window).
+    def _copy_frame (self):
+        if self._surface is None or not pygame.display.get_init():
+            return None
+        if self._frame is not None:
+            return self._frame.copy()
+        return self._surface.copy()
+
+
+    # A hidden method that shows an image in the window in place of this
+    # screen's contents.
+    def _show_image (self, image):
+        target = self._surface if self._frame is None else self._frame
+        if image.get_size() != target.get_size():
+            image = pygame.transform.scale(image, target.get_size())
+        target.blit(image, (0, 0))
+        self._present()
+        pygame.display.flip()
 
-        # Draw the screen
-        self.redraw()
+
+    # A hidden method that draws the old screen over a frame of this screen
+    # while it is fading in.  The old screen gets more transparent until the
+    # fade time is up.
+    def _draw_fade (self, surface):
+        old_image, duration, start = self._fade
+        elapsed = pygame.time.get_ticks() - start
+        if elapsed >= duration:
+            self._fade = None
+            return
+        old_image.set_alpha(255 - int(255 * elapsed / duration))
+        surface.blit(old_image, (0, 0))
+
+
+    # A hidden method that creates the pygame surface for the window.
+    def _set_mode (self):
+        if self._window_size is not None:
+            size = self._window_size
+        elif self._fullscreen:
+            size = (0, 0)
+        else:
+            size = (self._width, self._height)
+        flags = pygame.FULLSCREEN if self._fullscreen else 0
+
+        # Reuse the current window if it has the right size and mode, since
+        # creating a new one can be slow on some platforms
+        current = None
+        if pygame.display.get_init():
+            current = pygame.display.get_surface()
+        if (current is not None and 
+                bool(current.get_flags() & pygame.FULLSCREEN) == self._fullscreen and
+                (current.get_size() == size or size == (0, 0))):
+            self._surface = current
+        else:
+            self._surface = pygame.display.set_mode(size, flags)
+        self._create_frame()
+
+
+    # A hidden method that creates the frame that the screen is drawn on 
+    # when the window is not the same size as the screen.
+    def _create_frame (self):
+        window_width, window_height = self._surface.get_size()
+
+        # If the window is the same size, draw directly in the window
+        if (window_width, window_height) == (self._width, self._height):
+            self._frame = None
+            self._viewport = self._surface.get_rect()
+            return
+
+        # Find how much the frame needs to be scaled to fit in the window.
+        # Integer scaling is only used if the window is large enough.
+        factor = min(window_width / self._width, window_height / self._height)
+        if self._scaling == "integer" and factor >= 1:
+            factor = int(factor)
+
+        # Center the scaled frame in the window
+        self._viewport = pygame.Rect(0, 0, round(factor * self._width), 
+                                     round(factor * self._height))
+        self._viewport.center = window_width // 2, window_height // 2
+        self._frame = pygame.Surface((self._width, self._height)).convert()
+
+
+    # A hidden method that scales the frame onto the window.
+    def _present (self):
+        if self._frame is None:
+            return
+
+        # Fill any unused space around the viewport
+        if self._viewport.size != self._surface.get_size():
+            self._surface.fill("black")
+
+        # Scale the frame directly into the viewport
+        target = self._surface.subsurface(self._viewport)
+        if self._scaling == "smooth":
+            pygame.transform.smoothscale(self._frame, self._viewport.size, target)
+        else:
+            pygame.transform.scale(self._frame, self._viewport.size, target)
 
 
     # A hidden method that is called when a screen is closed.
     def _close (self):
-        # Stop all timers associated with the screen
-        for event_id in self._timers:
-            pygame.time.set_timer(event_id, 0)
+        # Keep a copy of the last frame if requested
+        if self._retain_frame:
+            self._last_frame = self._copy_frame()
 
-        # Clear the timers dictionary
+        # Stop all timers associated with the screen
         self._timers.clear()
+        self._timers.pause()
+
+        # Stop any fade that hasn't finished
+        self._fade = None
+
+
+    @property
+    def retain_frame (self):
+        '''
+        Whether or not the screen keeps a copy of the last frame that was 
+        drawn when another screen is opened.
+
+        When a screen that kept its last frame is opened again, that frame is 
+        shown immediately and stays until the game loop draws the screen 
+        again.  This uses extra memory for each screen, so it is off by 
+        default.
+        '''
+
+        return self._retain_frame
+
+    @retain_frame.setter
+    def retain_frame (self, new_setting):
+
+        self._retain_frame = bool(new_setting)
+        if not self._retain_frame:
+            self._last_frame = None
+
+
+    @property
+    def last_frame (self):
+        '''
+        A copy of the last frame that was drawn before this screen was closed.
+        (Read-only)
+
+        This will be `None` unless `retain_frame` is `True` and the screen 
+        has been closed.
+        '''
+
+        return self._last_frame
 
 
     @property
@@ -182,25 +422,31 @@ class Screen (pygame.sprite.LayeredUpdates):
 
         # If this screen is open, then we need to create a new pygame screen
         # width this size.
-        if self.is_open():
-            self._surface = pygame.display.set_mode((self._width, self._height))
+        if self.is_open:
+            self._set_mode()
             self.update()
 
-        # Create a new canvas with the new size
+        # Create a new canvas with the new size.  In retained mode, the 
+        # drawings are drawn again so that any parts that were cut off are 
+        # shown.  Otherwise, the old canvas is copied to the middle.
         old_canvas = self._canvas
         self._canvas = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
-        x = (self._width - old_width) // 2
-        y = (self._height - old_height) // 2
-        self._canvas.blit(old_canvas, (x, y))
+        if self._history is not None:
+            self._history.clear(self._canvas)
+        if self._display_list is not None:
+            self.rasterize()
+        else:
+            x = (self._width - old_width) // 2
+            y = (self._height - old_height) // 2
+            self._canvas.blit(old_canvas, (x, y))
 
         # Change the rect for the background image to keep it centered.
         if self._image_rect is not None:
-            self._image_rect.centerx = width / 2
-            self._image_rect.centery = height / 2
+            self._image_rect.centerx = self._width / 2
+            self._image_rect.centery = self._height / 2
 
-        # If showing the grid, recreate it
-        if self._show_grid:
-            self._create_grid()
+        # The grid needs to be recreated at the new size
+        self._grid = None
 
 
     @property
@@ -235,6 +481,94 @@ class Screen (pygame.sprite.LayeredUpdates):
         self.size = self._width, new_height
 
 
+    @property
+    def window_size (self):
+        '''
+        The size of the window that the screen is shown in.
+
+        By default, this is the same as the size of the screen.  If the window
+        is a different size, then everything is drawn at the screen's size and
+        the finished frame is scaled to fit the window.  This allows a small
+        screen (e.g. 320x180) to fill a large window cheaply.
+
+        Set this property to `None` to make the window the same size as the 
+        screen (or the size of the display when in fullscreen mode).
+        '''
+
+        if self.is_open:
+            return self._surface.get_size()
+        if self._window_size is not None:
+            return self._window_size
+        return self._width, self._height
+
+    @window_size.setter
+    def window_size (self, new_size):
+
+        if new_size is None:
+            self._window_size = None
+        else:
+            try:
+                self._window_size = tuple([int(d) for d in new_size])
+                assert len(self._window_size) == 2
+            except:
+                raise ValueError("The window size must be a tuple of two integers!") from None
+
+        # If this screen is open, then resize the window
+        if self.is_open:
+            self._set_mode()
+
+
+    @property
+    def fullscreen (self):
+        '''
+        Whether or not the screen fills the entire display.
+
+        Unless a `window_size` is given, the screen will be scaled to fit the
+        size of the display.
+        '''
+
+        return self._fullscreen
+
+    @fullscreen.setter
+    def fullscreen (self, is_fullscreen):
+
+        self._fullscreen = bool(is_fullscreen)
+
+        # If this screen is open, then recreate the window
+        if self.is_open:
+            self._set_mode()
+
+
+    @property
+    def scaling (self):
+        '''
+        How the screen is scaled when the window is a different size.
+
+        The scaling can be one of the following values:
+         - "integer" - The screen is enlarged by the largest whole number 
+           factor that fits in the window.  Pixels stay crisp, which is best
+           for pixel art.  This is the default.
+         - "smooth" - The screen is scaled to fill as much of the window as
+           possible and smoothed.
+
+        In both cases, the screen's shape is kept and any unused space in the 
+        window is filled with black.
+        '''
+
+        return self._scaling
+
+    @scaling.setter
+    def scaling (self, new_scaling):
+
+        if new_scaling not in ("integer", "smooth"):
+            raise ValueError("The scaling must be \"integer\" or \"smooth\"!")
+        self._scaling = new_scaling
+
+        # If this screen is open, then recalculate the viewport
+        if self.is_open:
+            self._create_frame()
+
+
     @property
     def title (self):
         '''
@@ -322,13 +656,34 @@ class Screen (pygame.sprite.LayeredUpdates):
             self._image_rect.centery = self._height / 2
 
 
+    # A hidden method that returns the grid, creating it only when it is
+    # needed.  Grids with the same size and properties are shared.
+    def _get_grid (self):
+        if self._grid is None:
+            key = (self._width, self._height, 
+                   tuple([(k, repr(v)) for k, v in self._grid_props.items()]))
+            grid = Screen._grid_cache.pop(key, None)
+            if grid is None:
+                grid = self._create_grid()
+
+            # Keep the most recently used grids in the cache
+            Screen._grid_cache[key] = grid
+            while len(Screen._grid_cache) > Screen._grid_cache_size:
+                Screen._grid_cache.pop(next(iter(Screen._grid_cache)))
+            self._grid = grid
+        return self._grid
+
+
     def _create_grid (self):
 
         width = self._width
         height = self._height
         grid = pygame.Surface((width, height), pygame.SRCALPHA)
 
-        font = pygame.font.SysFont("Arial", 12)
+        # The font for the labels is only loaded once
+        if Screen._grid_font is None:
+            Screen._grid_font = font_registry.get_font("Arial", 12)
+        font = Screen._grid_font
 
         x_dist = self._grid_props["x_dist"]
         y_dist = self._grid_props["y_dist"]
@@ -415,8 +770,7 @@ class Screen (pygame.sprite.LayeredUpdates):
         label = font.render("0", True, color)
         grid.blit(label, (width / 2 - label.get_width() - thickness // 2 - 3, height / 2 + thickness // 2 + 3))
 
-        # Set object attribute
-        self._grid = grid
+        return grid
     
     
     def configure_grid (self, **kwargs):
@@ -442,8 +796,7 @@ class Screen (pygame.sprite.LayeredUpdates):
                 raise KeyError(f"Invalid grid property: {prop}")
 
         self._grid_props.update(kwargs)
-        if self._show_grid:
-            self._create_grid()
+        self._grid = None
 
 
     @property
@@ -458,8 +811,69 @@ class Screen (pygame.sprite.LayeredUpdates):
     def show_grid (self, is_shown):
 
         self._show_grid = bool(is_shown)
-        if is_shown:
-            self._create_grid()
+
+
+    ### Methods for tile maps
+
+    def add_tile_map (self, tile_map, layer=0):
+        '''
+        Add a TileMap to the screen.
+
+        The tile map is drawn in the given `layer`, behind any sprites in
+        the same layer.  Use a negative layer (e.g. -3) to draw it behind the
+        drawings on the canvas.
+
+        Tile maps are not sprites, so they are not included when you loop
+        through the sprites on the screen or check what a sprite is touching.
+        Use the tile map's `is_touching()` method instead.
+        '''
+
+        if not isinstance(tile_map, TileMap):
+            raise ValueError("The tile map must be a TileMap!")
+        try:
+            layer = int(layer)
+        except:
+            raise ValueError("The layer must be an integer!") from None
+
+        # Moving a tile map that is already on the screen changes its layer
+        self.remove_tile_map(tile_map)
+        self._tile_maps.append((layer, tile_map))
+        self._tile_maps.sort(key=lambda entry: entry[0])
+
+
+    def remove_tile_map (self, tile_map):
+        '''
+        Remove a TileMap from the screen.
+        '''
+
+        self._tile_maps = [entry for entry in self._tile_maps 
+                           if entry[1] is not tile_map]
+
+
+    @property
+    def tile_maps (self):
+        '''
+        A list of the TileMaps on the screen from the back to the front.
+        (Read-only)
+        '''
+
+        return [tile_map for _, tile_map in self._tile_maps]
+
+
+    ### Methods for the camera
+
+    @property
+    def camera (self):
+        '''
+        The camera that determines which part of the world is shown on the
+        screen.  (Read-only)
+
+        Move the camera instead of moving every sprite to scroll through a 
+        world that is larger than the screen.  See the `Camera` class for 
+        details.
+        '''
+
+        return self._camera
 
 
     ### Methods for the drawing canvas
@@ -470,15 +884,236 @@ class Screen (pygame.sprite.LayeredUpdates):
         The image of any drawings that were drawn on the screen.
         '''
 
+        self._flush_drawings()
         return self._canvas
 
 
+    # A hidden method that is called by a painter that has lines waiting to
+    # be drawn on the canvas.
+    def _add_pending_painter (self, painter):
+        if painter not in self._pending_painters:
+            self._pending_painters.append(painter)
+
+
+    # A hidden method that draws the lines that painters have waiting.  This
+    # must be called before the canvas is used.
+    def _flush_drawings (self):
+        while self._pending_painters:
+            painter = self._pending_painters.pop(0)
+            if self in painter.groups():
+                painter._flush_paths()
+
+
+    # A hidden method that makes the painters on this screen forget where
+    # their last lines ended on the canvas.  This must be called when part 
+    # of the canvas is erased, since those line ends might be gone.
+    def _forget_stroke_ends (self):
+        for sprite in self:
+            stroke_ends = getattr(sprite, "_stroke_ends", None)
+            if stroke_ends:
+                stroke_ends.pop(self._canvas, None)
+
+
+    @property
+    def retained (self):
+        '''
+        Whether or not the drawings on the canvas are also recorded.
+
+        When this is `True`, everything that a Painter draws is recorded as
+        a list of commands as well as being drawn on the canvas.  This lets
+        the canvas be drawn again if the screen is resized or at a different
+        scale using `render_canvas()`.  Anything that was already on the
+        canvas when this is turned on is recorded as a picture.
+        '''
+
+        return self._display_list is not None
+
+    @retained.setter
+    def retained (self, is_retained):
+
+        # Only start/stop recording if the setting changed
+        if bool(is_retained) == self.retained:
+            return
+
+        if not is_retained:
+            self._display_list = None
+            return
+
+        # Keep the drawings that are already on the canvas as a picture
+        self._display_list = DisplayList()
+        rect = self._canvas.get_bounding_rect()
+        if rect.width > 0 and rect.height > 0:
+            left, top = self.from_pygame_coordinates(rect.topleft)
+            right, bottom = self.from_pygame_coordinates(rect.bottomright)
+            self._display_list.add("image", (left, bottom, right, top), 
+                                   self._canvas.subsurface(rect).copy(), (left, top))
+
+
+    # A hidden method that records a drawing command if the screen is in 
+    # retained mode.  The box is (left, bottom, right, top).
+    def _record (self, kind, box, *data):
+        if self._display_list is not None:
+            self._display_list.add(kind, box, *data)
+
+
+    # A hidden method that turns two corners into a box
+    def _corners_to_box (self, corner1, corner2):
+        try:
+            corner1 = pygame.Vector2(corner1)
+            corner2 = pygame.Vector2(corner2)
+        except:
+            raise ValueError("Invalid corner position!")
+        return (min(corner1.x, corner2.x), min(corner1.y, corner2.y),
+                max(corner1.x, corner2.x), max(corner1.y, corner2.y))
+
+
+    def rasterize (self, corner1=None, corner2=None):
+        '''
+        Draw the recorded drawings on the canvas again.
+
+        If two corners are given, only the rectangle between them is redrawn.
+        This only works in retained mode.
+        '''
+
+        self._flush_drawings()
+
+        if self._display_list is None:
+            raise RuntimeError("The screen isn't in retained mode!")
+
+        # Find the part of the canvas to redraw
+        if corner1 is None:
+            box = None
+            rect = self._canvas.get_rect()
+        else:
+            if corner2 is None:
+                raise ValueError("Both corners must be given!")
+            box = self._corners_to_box(corner1, corner2)
+            top_left = self.to_pygame_coordinates(box[0], box[3])
+            bottom_right = self.to_pygame_coordinates(box[2], box[1])
+            rect = pygame.Rect(top_left, bottom_right - top_left)
+            rect.width += 1
+            rect.height += 1
+
+        # Erase that part and draw the commands that touch it
+        self._touch_canvas(rect)
+        self._canvas.set_clip(rect)
+        try:
+            self._canvas.fill(0, rect)
+            self._display_list.draw(self._canvas, (-self._width / 2, self._height / 2),
+                                    1, box)
+        finally:
+            self._canvas.set_clip(None)
+
+
+    def render_canvas (self, scale=1, corner1=None, corner2=None):
+        '''
+        Get a new picture of the recorded drawings drawn at the given `scale`.
+
+        If two corners are given, the picture only shows the rectangle 
+        between them.  Otherwise, it shows the area of the screen.  This 
+        only works in retained mode.
+
+        This function returns a pygame Surface.
+        '''
+
+        self._flush_drawings()
+
+        if self._display_list is None:
+            raise RuntimeError("The screen isn't in retained mode!")
+
+        # Ensure that the scale is a positive number
+        try:
+            scale = float(scale)
+        except:
+            raise ValueError("The scale must be a number!") from None
+        if scale <= 0:
+            raise ValueError("The scale must be positive!")
+
+        # Find the area to draw
+        if corner1 is None:
+            box = (-self._width / 2, -self._height / 2, 
+                   self._width / 2, self._height / 2)
+        else:
+            if corner2 is None:
+                raise ValueError("Both corners must be given!")
+            box = self._corners_to_box(corner1, corner2)
+        left, bottom, right, top = box
+
+        # Create the picture and draw the commands on it
+        size = (max(1, math.ceil((right - left) * scale)), 
+                max(1, math.ceil((top - bottom) * scale)))
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        self._display_list.draw(image, (left, top), scale, box)
+        return image
+
+
+    @contextlib.contextmanager
+    def canvas_array (self, kind="rgb"):
+        '''
+        Get the pixels of the canvas as a NumPy array.
+
+        This is used in a `with` statement, like this:
+
+            with screen.canvas_array() as pixels:
+                pixels[:, :, 0] = 255 - pixels[:, :, 0]
+
+        The array uses the canvas's pixels directly, so any changes made to
+        it change the canvas right away without copying anything.  It is
+        indexed by x and then y in pygame coordinates.  The `kind` can be:
+         - "rgb": an array of [red, green, blue] values for each pixel
+         - "alpha": an array of the opacity of each pixel
+         - "mapped": an array of whole numbers with the colors packed in
+
+        The canvas is locked while the array exists and a locked canvas 
+        can't be drawn, so don't keep the array after the `with` statement.
+        If you use it outside of a function, delete it at the end with 
+        `del pixels`.  NumPy must be installed to use this method.  Changes 
+        made to the array are not recorded in retained mode.
+        '''
+
+        self._flush_drawings()
+
+        # NumPy is only needed for this method
+        try:
+            import numpy
+            import pygame.surfarray
+        except ImportError:
+            raise ImportError("NumPy must be installed to get the canvas as an array!") from None
+
+        if kind == "rgb":
+            make_view = pygame.surfarray.pixels3d
+        elif kind == "alpha":
+            make_view = pygame.surfarray.pixels_alpha
+        elif kind == "mapped":
+            make_view = pygame.surfarray.pixels2d
+        else:
+            raise ValueError("The kind must be \"rgb\", \"alpha\" or \"mapped\"!")
+
+        # Any part of the canvas could be changed
+        self._touch_canvas(self._canvas.get_rect())
+
+        # Give a view of the pixels.  This method's reference to it is let
+        # go even if the with statement raises an error, so the canvas is
+        # unlocked as soon as the caller lets go of it too.
+        view = make_view(self._canvas)
+        try:
+            yield view
+        finally:
+            del view
+
+
     def clear_canvas (self, remove_sprites=False):
         '''
         Clear everything that was drawn on the screen.
         '''
 
+        self._flush_drawings()
+
+        self._touch_canvas(self._canvas.get_rect())
         self._canvas.fill(0)
+        self._forget_stroke_ends()
+        if self._display_list is not None:
+            self._display_list.clear()
 
         # Remove any sprites that are on the screen.
         if remove_sprites:
@@ -494,6 +1129,8 @@ class Screen (pygame.sprite.LayeredUpdates):
         Clear a rectangular part of the screen.
         '''
 
+        self._flush_drawings()
+
         # Ensure that the points are actually points
         try:
             corner1 = pygame.Vector2(corner1)
@@ -506,12 +1143,15 @@ class Screen (pygame.sprite.LayeredUpdates):
         right = max(corner1.x, corner2.x)
         bottom = min(corner1.y, corner2.y)
         top = max(corner1.y, corner2.y)
+        self._record("clear_rect", (left, bottom, right, top))
 
         # Create a rect and fill that area with nothing
         top_left = self.to_pygame_coordinates(left, top)
         size = pygame.Vector2(right - left, top - bottom)
         rect = pygame.Rect(top_left, size)
+        self._touch_canvas(rect)
         self._canvas.fill(0, rect)
+        self._forget_stroke_ends()
 
         # Remove any sprites that are in the rectangle.
         if remove_sprites:
@@ -525,6 +1165,8 @@ class Screen (pygame.sprite.LayeredUpdates):
         Clear a circular part of the screen.
         '''
 
+        self._flush_drawings()
+
         # Ensure that the center and radius are good
         try:
             center = pygame.Vector2(center)
@@ -533,8 +1175,14 @@ class Screen (pygame.sprite.LayeredUpdates):
             raise ValueError("Invalid argument!")
 
         # Draw a circle of nothing
+        self._record("clear_circle", (center.x - radius, center.y - radius,
+                                      center.x + radius, center.y + radius),
+                     center, radius)
         pygame_center = self.to_pygame_coordinates(center)
+        self._touch_canvas((pygame_center.x - radius - 1, pygame_center.y - radius - 1,
+                            2 * radius + 3, 2 * radius + 3))
         pygame.draw.circle(self._canvas, 0, pygame_center, radius)
+        self._forget_stroke_ends()
 
         # Remove any sprites that are in the circle
         if remove_sprites:
@@ -549,6 +1197,8 @@ class Screen (pygame.sprite.LayeredUpdates):
         drawings and sprites.
         '''
 
+        self._flush_drawings()
+
         # Clear the background
         self._color = "white"
         self._color_obj = pygame.Color("white")
@@ -556,10 +1206,15 @@ class Screen (pygame.sprite.LayeredUpdates):
         self._image_name = None
 
         # Clear the drawings canvas
+        self._touch_canvas(self._canvas.get_rect())
         self._canvas.fill(0)
+        self._forget_stroke_ends()
+        if self._display_list is not None:
+            self._display_list.clear()
 
-        # Remove the sprites
+        # Remove the sprites and tile maps
         self.empty()
+        self._tile_maps = []
 
 
     def update (self, *args, **kwargs):
@@ -577,10 +1232,15 @@ class Screen (pygame.sprite.LayeredUpdates):
         if "screen" not in kwargs:
             kwargs["screen"] = self
 
-        # Create a surface to put any drawings that should only be present for
-        # this update
-        self._update_drawings = pygame.Surface((self._width, self._height), 
-                                               pygame.SRCALPHA)
+        # Clear the surface that holds any drawings that should only be 
+        # present for this update.  It is only created again if the size of
+        # the screen changed.
+        if (self._update_drawings is None or 
+                self._update_drawings.get_size() != (self._width, self._height)):
+            self._update_drawings = pygame.Surface((self._width, self._height), 
+                                                   pygame.SRCALPHA)
+        else:
+            self._update_drawings.fill((0, 0, 0, 0))
 
         # Call update() on all of the sprites
         pygame.sprite.LayeredUpdates.update(self, *args, **kwargs)
@@ -598,42 +1258,90 @@ class Screen (pygame.sprite.LayeredUpdates):
         surface using this method by explicitely supplying a `surface` argument.
         '''
 
-        # If no surface is explicitly given, draw to this screen's surface
+        self._flush_drawings()
+
+        # An array from canvas_array() that is still around keeps the canvas
+        # locked, which would make the blits fail
+        if self._canvas.get_locked():
+            raise RuntimeError("The canvas is locked!  Don't keep the array from canvas_array() after the with statement.")
+
+        # If no surface is explicitly given, draw to this screen's surface.
+        # If the screen is scaled, draw to the frame and scale it afterwards.
+        present = surface is None
         if surface is None:
-            surface = self._surface
+            surface = self._surface if self._frame is None else self._frame
 
         # Draw the background
         surface.fill(self._color)
         if self._image is not None:
             surface.blit(self._image, self._image_rect)
 
-        # Create a sprite to hold the drawings
-        canvas_sprite = pygame.sprite.Sprite()
-        canvas_sprite.image = pygame.Surface((self._width, self._height), 
-                                             pygame.SRCALPHA)
-        canvas_sprite.image.blit(self._canvas, (0, 0))
-        canvas_sprite.image.blit(self._update_drawings, (0, 0))
-        canvas_sprite.rect = pygame.Rect(0, 0, self._width, self._height)
-        self.add(canvas_sprite, layer=-2)
-
-        # Create a sprite to hold the grid
+        # Collect the images to draw in layer order.  The drawings are drawn
+        # behind layer -1, the grid is drawn behind layer 0 and tile maps are
+        # drawn behind the sprites in their layer.  The layers are sorted by
+        # (layer, order) so that ties are broken in that way.  Any sprites
+        # that are outside of the camera's view are skipped and tile maps 
+        # only draw their visible chunks.
+        blits = []
+        layers = [((-2, 2), self._canvas), ((-2, 2), self._update_drawings)]
         if self._show_grid:
-            grid_sprite = pygame.sprite.Sprite()
-            grid_sprite.image = self._grid
-            grid_sprite.rect = pygame.Rect(0, 0, self._width, self._height)
-            self.add(grid_sprite, layer=-1)
-
-        # Draw the sprites
-        ret = pygame.sprite.LayeredUpdates.draw(self, surface)
-
-        # Remove the extra sprites
-        self.remove(canvas_sprite)
-        if self._show_grid:
-            self.remove(grid_sprite)
+            layers.append(((-1, 2), self._get_grid()))
+        if self._tile_maps:
+            layers.extend(((layer, 0), tile_map) for layer, tile_map in self._tile_maps)
+            layers.sort(key=lambda entry: entry[0])
+        for sprite in self.sprites():
+            sprite_order = (self.get_layer_of_sprite(sprite), 1)
+            while layers and layers[0][0] < sprite_order:
+                self._add_layer_blits(blits, layers.pop(0)[1])
+            if not getattr(sprite, "_culled", False):
+                blits.append((sprite.image, self._interpolate_rect(sprite)))
+        for _, layer in layers:
+            self._add_layer_blits(blits, layer)
+
+        # Draw everything at once
+        ret = surface.blits(blits)
+
+        # Draw the old screen if this one is still fading in and scale the 
+        # frame to the window
+        if present:
+            if self._fade is not None:
+                self._draw_fade(surface)
+            self._present()
 
         return ret
     
     
+    # A hidden method that adds the blits for something that is drawn as a 
+    # layer instead of a sprite: a tile map or a surface the size of the 
+    # screen.
+    def _add_layer_blits (self, blits, layer):
+        if isinstance(layer, TileMap):
+            blits.extend(layer._visible_blits(self))
+        else:
+            self._camera._add_layer_blit(blits, layer)
+
+
+    # A hidden method that stores the positions of the sprites before the
+    # game loop updates them so that they can be drawn in between.
+    def _store_positions (self):
+        for sprite in self.sprites():
+            if hasattr(sprite, "_pos"):
+                sprite._previous_pos = pygame.Vector2(sprite._pos)
+
+
+    # A hidden method that returns the rect where a sprite should be drawn.
+    # If the sprite moved in the last update, it is drawn part of the way
+    # between its previous and current positions.
+    def _interpolate_rect (self, sprite):
+        previous = getattr(sprite, "_previous_pos", None)
+        if self._interpolation is None or previous is None or previous == sprite._pos:
+            return sprite.rect
+        position = previous.lerp(sprite._pos, self._interpolation)
+        offset = (self._camera.to_pygame_coordinates(position) - 
+                  self._camera.to_pygame_coordinates(sprite._pos))
+        return sprite.rect.move(round(offset.x), round(offset.y))
+
+
     def redraw (self):
         '''
         Update and draw the screen in the open window.
@@ -645,6 +1353,134 @@ class Screen (pygame.sprite.LayeredUpdates):
         self.update()
         self.draw()
         pygame.display.flip()
+        self._tracer_count = 0
+        self._tracer_last = pygame.time.get_ticks()
+
+
+    def tracer (self, n=1, delay=0):
+        '''
+        Set how often turtles redraw the screen when the game loop isn't 
+        running.
+
+        Normally, the screen is redrawn every time a turtle changes.  If `n`
+        is more than 1, the screen is only redrawn after every `n` changes.
+        If `n` is 0, the screen is never redrawn automatically.  The `delay`
+        is the least amount of time (in milliseconds) between redraws.
+
+        Call `redraw()` to show any changes that haven't been drawn yet.
+        Drawing with thousands of moves is much faster with `n` set to 0 and
+        a call to `redraw()` at the end.
+        '''
+
+        # Ensure that n and the delay are good
+        try:
+            n = int(n)
+            delay = float(delay)
+        except:
+            raise ValueError("The tracer settings must be numbers!") from None
+        if n < 0 or delay < 0:
+            raise ValueError("The tracer settings can't be negative!")
+
+        self._tracer_n = n
+        self._tracer_delay = delay
+        self._tracer_count = 0
+
+
+    # A hidden method that is called when a turtle changes.  The screen is 
+    # drawn if enough changes were made and enough time has passed since it 
+    # was last drawn.
+    def _request_redraw (self):
+        if self._tracer_n == 0:
+            return
+        self._tracer_count += 1
+        if self._tracer_count < self._tracer_n:
+            return
+        now = pygame.time.get_ticks()
+        if self._tracer_delay and now - self._tracer_last < self._tracer_delay:
+            return
+        self._tracer_count = 0
+        self._tracer_last = now
+        self.draw()
+        pygame.display.flip()
+
+
+    ### Methods for the canvas history
+
+    def start_history (self, max_memory=64, compress=False):
+        '''
+        Start keeping a history of the canvas so that drawings can be undone.
+
+        Only the parts of the canvas that are drawn on are saved.  Everything
+        drawn between calls to `checkpoint()` is one step that will be undone
+        at once.  The `max_memory` is the most memory (in megabytes) that the
+        history can use before the oldest steps are forgotten.  If `compress`
+        is `True`, the history uses less memory but is slower.
+        '''
+
+        self._history = CanvasHistory(self._canvas, max_memory, compress)
+
+
+    def stop_history (self):
+        '''
+        Stop keeping a history of the canvas and forget all of the steps.
+        '''
+
+        self._history = None
+
+
+    # A hidden method that is called before part of the canvas (given as a 
+    # rect in pygame coordinates) is changed.
+    def _touch_canvas (self, rect):
+        if self._history is not None:
+            self._history.touch(rect)
+
+
+    def checkpoint (self):
+        '''
+        End the current step of the canvas history.
+
+        Call this after each complete drawing (e.g. when the mouse button is
+        released after drawing a line).
+        '''
+
+        self._flush_drawings()
+
+        if self._history is None:
+            raise RuntimeError("The screen isn't keeping a history!")
+        self._history.checkpoint()
+
+
+    def undo (self):
+        '''
+        Undo the last step of the canvas history.
+
+        Returns `True` if something was undone or `False` if there is 
+        nothing to undo.  This doesn't change the drawings recorded in 
+        retained mode.
+        '''
+
+        self._flush_drawings()
+
+        if self._history is None:
+            raise RuntimeError("The screen isn't keeping a history!")
+        self._forget_stroke_ends()
+        return self._history.undo()
+
+
+    def redo (self):
+        '''
+        Redo the last step of the canvas history that was undone.
+
+        Returns `True` if something was redone or `False` if there is 
+        nothing to redo.
+        '''
+
+        self._flush_drawings()
+
+        if self._history is None:
+            raise RuntimeError("The screen isn't keeping a history!")
+        self._forget_stroke_ends()
+        return self._history.redo()
 
 
     ### Methods to add event handlers
@@ -662,6 +1498,7 @@ class Screen (pygame.sprite.LayeredUpdates):
         have a handler.
         '''
 
+        self._handler_version += 1
         if key is None:
             if func is None:
                 self._key_press_funcs.pop(None, None)
@@ -698,6 +1535,7 @@ class Screen (pygame.sprite.LayeredUpdates):
         have a handler.
         '''
 
+        self._handler_version += 1
         if key is None:
             if func is None:
                 self._key_release_funcs.pop(None, None)
@@ -737,6 +1575,7 @@ class Screen (pygame.sprite.LayeredUpdates):
         have a handler.
         '''
 
+        self._handler_version += 1
         if key is None:
             if func is None:
                 self._key_hold_funcs.pop(None, None)
@@ -782,6 +1621,7 @@ class Screen (pygame.sprite.LayeredUpdates):
         # If a button is valid, add the function to the appropriate button
         if 1 <= button <= 5:
             self._click_funcs[button - 1] = func
+            self._handler_version += 1
         else:
             raise ValueError("Invalid button!")
 
@@ -808,6 +1648,7 @@ class Screen (pygame.sprite.LayeredUpdates):
         # If a button is valid, add the function to the appropriate button
         if 1 <= button <= 5:
             self._release_funcs[button - 1] = func
+            self._handler_version += 1
         else:
             raise ValueError("Invalid button!")
 
@@ -821,10 +1662,13 @@ class Screen (pygame.sprite.LayeredUpdates):
          - `x` - will provide x-coordinate of the click
          - `y` - will provide y-coordinate of the click
          - `pos` - will provide a tuple of the coordinates (x and y) of the click
+         - `path` - will provide a list of the positions that the mouse moved
+           through (see the `coalesce_mouse_motion` property of the game loop)
         '''
 
         # Add the function
         self._mouse_move_func = func
+        self._handler_version += 1
 
 
     def on_timer (self, func, delay, repeat=False):
@@ -836,12 +1680,17 @@ class Screen (pygame.sprite.LayeredUpdates):
         positive number.
 
         If `repeat` is `True`, then the timer will run repeatedly.  That is,
-        the timer will restart every time that it expires.
+        the timer will restart every time that it expires.  Timers are 
+        checked once per frame, so a repeating timer that is shorter than a
+        frame is called several times in a row to keep up, up to 10 times
+        per frame.
 
-        An event ID will be returned that can be used with the `cancel_timer()`
+        A timer ID will be returned that can be used with the `cancel_timer()`
         method to stop the timer.
 
-        If the screen is closed this timer will be closed.  To prevent this
+        The timer only counts down while this screen is open, so a timer
+        created before the screen is opened starts when it opens.  If the 
+        screen is closed this timer will be closed.  To prevent this
         behaviour, create a global timer on the event loop.
         '''
 
@@ -851,30 +1700,29 @@ class Screen (pygame.sprite.LayeredUpdates):
         if delay <= 0:
             raise ValueError("The delay must be positive!")
 
-        # Get a custom pygame event type and start the timer
-        event_id = pygame.event.custom_type()
-        self._timers[event_id] = func
-        pygame.time.set_timer(event_id, delay, not repeat)
-
-        # Return the custom event type for cancelling
-        return event_id
+        # Start the timer and return its ID for cancelling
+        return self._timers.add(func, delay, repeat)
 
 
-    def cancel_timer (self, event_id):
+    def cancel_timer (self, timer_id=None, *, event_id=None):
         '''
-        Stop the timer with the given event ID.
+        Stop the timer with the given ID.
 
-        `event_id` must be an event ID that was returned from the `on_timer()`
-        method for this EventLoop.
+        `timer_id` must be a timer ID that was returned from the `on_timer()`
+        method for this Screen.  The old `event_id` keyword still works, but
+        is deprecated.
         '''
 
-        # Check that the argument is a valid event type
-        if event_id not in self._timers:
-            raise ValueError("There is no screen timer with that event ID!")
+        # Accept the old name of the argument
+        if event_id is not None:
+            warnings.warn("The event_id argument is deprecated!  Use timer_id instead.",
+                          DeprecationWarning, 2)
+            if timer_id is None:
+                timer_id = event_id
 
-        # Stop the timer
-        pygame.time.set_timer(event_id, 0)
-        self._timers.pop(event_id)
+        # Check that the argument is a valid timer and stop it
+        if not self._timers.cancel(timer_id):
+            raise ValueError("There is no screen timer with that timer ID!")
 
 
     ### Methods to convert to and from pygame coordinates
@@ -909,6 +1757,227 @@ class Screen (pygame.sprite.LayeredUpdates):
         y = self._height / 2 - pygame_y
         return x, y
 
+    def from_window_coordinates (self, window_x, window_y=None):
+        '''
+        Convert a point in the window (e.g. the position of the mouse) to the
+        same point in this screen's coordinate space.
+
+        Unlike `from_pygame_coordinates()`, this takes into account any 
+        scaling of the screen to fit the window and the position and zoom
+        of the camera.
+        '''
+
+        # If only one argument is given, expand it into x and y
+        if window_y is None:
+            window_x, window_y = window_x
+
+        # Undo the scaling of the frame in the window
+        if self._frame is not None:
+            viewport = self._viewport
+            window_x = (window_x - viewport.x) * self._width / viewport.width
+            window_y = (window_y - viewport.y) * self._height / viewport.height
+
+        return self._camera.from_pygame_coordinates(window_x, window_y)
+
+
+################################################################################
+#                                 CAMERA CLASS
+################################################################################
+
+class Camera (object):
+    '''
+    A Camera determines which part of the world is visible on a screen.
+
+    Every Screen has its own camera, which can be accessed using the screen's
+    `camera` property.  By default, the camera is centered at (0, 0) and is 
+    not zoomed, so the screen's coordinates are the world's coordinates.
+
+    Camera objects store the following information:
+     - The position in the world that is shown at the center of the screen
+     - How much the world is zoomed in or out
+
+    Sprites and drawings that are completely outside of the camera's view
+    are not transformed or drawn, so large worlds only cost what is visible.
+    '''
+
+    def __init__ (self, screen):
+        '''
+        Create a Camera object.
+
+        Camera objects should not be created explicitly.  Use a screen's
+        `camera` property instead.
+        '''
+
+        self._screen = screen
+        self._pos = pygame.Vector2(0, 0)
+        self._zoom = 1
+
+
+    @property
+    def position (self):
+        '''
+        The position in the world that is shown at the center of the screen.
+        '''
+
+        return tuple(self._pos)
+
+    @position.setter
+    def position (self, new_position):
+
+        try:
+            self._pos = pygame.Vector2(new_position)
+        except:
+            raise ValueError("Invalid position!") from None
+
+
+    @property
+    def x (self):
+        '''
+        The x-coordinate of the camera's position.
+        '''
+
+        return self._pos.x
+
+    @x.setter
+    def x (self, new_x):
+
+        try:
+            self.position = new_x, self._pos.y
+        except:
+            raise ValueError("Invalid x-coordinate!") from None
+
+
+    @property
+    def y (self):
+        '''
+        The y-coordinate of the camera's position.
+        '''
+
+        return self._pos.y
+
+    @y.setter
+    def y (self, new_y):
+
+        try:
+            self.position = self._pos.x, new_y
+        except:
+            raise ValueError("Invalid y-coordinate!") from None
+
+
+    @property
+    def zoom (self):
+        '''
+        How much the world is magnified.
+
+        A zoom greater than 1 will zoom in and a zoom less than 1 will zoom 
+        out.  A zoom of 1 shows the world at its actual size.
+        '''
+
+        return self._zoom
+
+    @zoom.setter
+    def zoom (self, new_zoom):
+
+        # Ensure that the zoom is a number
+        try:
+            new_zoom = float(new_zoom)
+        except:
+            raise ValueError("The zoom must be a number!") from None
+
+        # Ensure that the zoom is positive
+        if new_zoom <= 0:
+            raise ValueError("The zoom must be positive!")
+
+        self._zoom = new_zoom
+
+
+    ### Methods to convert to and from pygame coordinates
+
+    def to_pygame_coordinates (self, x, y=None):
+        '''
+        Convert a point in the world to the point in the pygame coordinate 
+        space where it appears on the screen.
+        '''
+
+        # If only one argument is given, expand it into x and y
+        if y is None:
+            x, y = x
+
+        # Calcuate the pygame point and return it as a vector
+        pygame_x = (x - self._pos.x) * self._zoom + self._screen._width / 2
+        pygame_y = self._screen._height / 2 - (y - self._pos.y) * self._zoom
+        return pygame.Vector2(pygame_x, pygame_y)
+
+    def from_pygame_coordinates (self, pygame_x, pygame_y=None):
+        '''
+        Convert a point in the pygame coordinate space to the point in the
+        world that appears there on the screen.
+        '''
+
+        # If only one argument is given, expand it into x and y
+        if pygame_y is None:
+            pygame_x, pygame_y = pygame_x
+
+        # Calculate the world coordinates and return it as a tuple
+        x = (pygame_x - self._screen._width / 2) / self._zoom + self._pos.x
+        y = (self._screen._height / 2 - pygame_y) / self._zoom + self._pos.y
+        return x, y
+
+
+    ### Methods for culling
+
+    def can_see (self, x, y=None, radius=0):
+        '''
+        Return whether or not any part of a circle centered at the given 
+        point with the given `radius` is in the camera's view.
+        '''
+
+        # If only one argument is given, expand it into x and y
+        if y is None:
+            x, y = x
+
+        half_width = self._screen._width / 2 / self._zoom + radius
+        half_height = self._screen._height / 2 / self._zoom + radius
+        return (abs(x - self._pos.x) <= half_width and 
+                abs(y - self._pos.y) <= half_height)
+
+
+    # A hidden method that adds the visible part of a layer the size of the 
+    # screen (e.g. the canvas) to a list of blits.
+    def _add_layer_blit (self, blits, layer):
+        if layer is None:
+            return
+
+        # If the camera hasn't moved, the whole layer is visible
+        if self._zoom == 1 and self._pos.x == 0 and self._pos.y == 0:
+            blits.append((layer, (0, 0)))
+            return
+
+        # Find the part of the layer that is in view
+        width = self._screen._width
+        height = self._screen._height
+        left = (1 - 1 / self._zoom) * width / 2 + self._pos.x
+        top = (1 - 1 / self._zoom) * height / 2 - self._pos.y
+        area = pygame.Rect(int(left), int(top), 
+                           int(width / self._zoom) + 2, 
+                           int(height / self._zoom) + 2)
+        area = area.clip(layer.get_rect())
+        if area.width == 0 or area.height == 0:
+            return
+
+        # Find where that part appears on the screen
+        dest = self.to_pygame_coordinates(area.x - width / 2, 
+                                          height / 2 - area.y)
+
+        # Only the visible part of the layer is scaled
+        if self._zoom == 1:
+            blits.append((layer, (round(dest.x), round(dest.y)), area))
+        else:
+            size = (round(area.width * self._zoom), 
+                    round(area.height * self._zoom))
+            image = pygame.transform.scale(layer.subsurface(area), size)
+            blits.append((image, (round(dest.x), round(dest.y))))
+
 
 ################################################################################
 #                               GLOBAL FUNCTIONS
@@ -948,6 +2017,7 @@ def from_pygame_coordinates (pygame_x, pygame_y=None):
 
 # What is included when importing *
 __all__ = [
+    "Camera",
     "Screen", 
     "get_active_screen", 
     "to_pygame_coordinates", 
@@ -27,6 +27,10 @@ import pygame
 
 from . import pgputils
 from .screen import Screen, get_active_screen, to_pygame_coordinates
+from .gameloop import get_game_loop
+
+# The game loop, which keeps track of the time between updates
+_game_loop = get_game_loop()
 
 ################################################################################
 #                               HELPER FUNCTIONS
@@ -35,6 +39,9 @@ from .screen import Screen, get_active_screen, to_pygame_coordinates
 def get_dimensions (obj, tilt, scale, rotation):
     if isinstance(obj, pygame.Surface):
         dims = pygame.Vector2(obj.get_size())
+    elif isinstance(obj, tuple) and isinstance(obj[0], pygame.Vector2):
+        dims = pygame.Vector2(2 * max([abs(p.x) for p in obj]),
+                              2 * max([abs(p.y) for p in obj]))
     else:
         dims = pygame.Vector2(obj)
     diag_1 = dims * scale
@@ -102,6 +109,7 @@ class Sprite (pygame.sprite.Sprite):
                 self._original = pygame.image.load(image).convert_alpha()
         self._opacity = 1
         self._dirty_visible = False
+        self._culled = False
 
 
         # The .image and .rect attributes are needed for drawing sprites
@@ -132,6 +140,7 @@ class Sprite (pygame.sprite.Sprite):
         self._tilt = 0
         self._dirty_rotate = False
         self._dirty_mask = True
+        self._zoom = 1
 
         # Attributes for lines and fill of polygon images
         self._linecolor = "black"
@@ -447,7 +456,7 @@ class Sprite (pygame.sprite.Sprite):
 
         return self._pos.y
 
-    @center_x.setter
+    @center_y.setter
     def center_y (self, new_coordinate):
 
         self.y = new_coordinate
@@ -1062,17 +1071,23 @@ class Sprite (pygame.sprite.Sprite):
 
     # Helper method that scales and/or rotates the image if it is dirty
     def _clean_image (self, screen=None):
+        # The image also needs to be scaled if the camera's zoom changed
+        if screen is None:
+            screen = get_active_screen()
+        zoom = 1 if screen is None else screen.camera.zoom
+        dirty_scale = self._dirty_scale or zoom != self._zoom
+        scale = self._scale * zoom
+
         # If the image is a polygon, scale and rotate the points before drawing it
         if isinstance(self._original, tuple):
-            if self._dirty_scale:
-                self._scaled = tuple([self._scale * p for p in self._flipped])
-                self._dirty_flip = True
-                self._dirty_scale = False
-
-            if self._dirty_flip:
+            if dirty_scale or self._dirty_flip:
                 self._flipped = pgputils.flip_polygon(self._original,
                         self._horizontal_flip, self._vertical_flip)
+                self._scaled = tuple([scale * p for p in self._flipped])
+                self._zoom = zoom
+                self._dirty_mask = True
                 self._dirty_rotate = True
+                self._dirty_scale = False
                 self._dirty_flip = False
 
             if self._dirty_rotate:
@@ -1080,20 +1095,22 @@ class Sprite (pygame.sprite.Sprite):
                 self._rotated = tuple([p.rotate(angle) for p in self._scaled])
                 self._dirty_rotate = False
                 self.image = pgputils.polygon_to_surface(self._rotated,
-                                self._linecolor, self._fillcolor, round(self._scale))
+                                self._linecolor, self._fillcolor, round(scale))
 
         # Otherwise, scale and rotate the surfaces
         else:
-            if self._dirty_scale:
+            if dirty_scale:
                 orig_width, orig_height = self._original.get_size()
-                new_width = round(self._scale * orig_width)
-                new_height = round(self._scale * orig_height)
+                new_width = round(scale * orig_width)
+                new_height = round(scale * orig_height)
                 if self._smooth:
                     self._scaled = pygame.transform.smoothscale(
                             self._original, (new_width, new_height))
                 else:
                     self._scaled = pygame.transform.scale(
                             self._original, (new_width, new_height))
+                self._zoom = zoom
+                self._dirty_mask = True
                 self._dirty_flip = True
                 self._dirty_scale = False
 
@@ -1121,7 +1138,20 @@ class Sprite (pygame.sprite.Sprite):
         if screen is None:
             self.rect.center = to_pygame_coordinates(self._pos - offset_vec)
         else:
-            self.rect.center = screen.to_pygame_coordinates(self._pos - offset_vec)
+            self.rect.center = screen.camera.to_pygame_coordinates(self._pos - offset_vec)
+
+    # Helper method that finds the radius of a circle around the sprite's 
+    # position that contains the entire image, no matter how it is rotated.
+    def _bounding_radius (self):
+        if isinstance(self._original, tuple):
+            half_width = max([abs(p.x) for p in self._original]) + self._linesize
+            half_height = max([abs(p.y) for p in self._original]) + self._linesize
+        else:
+            half_width, half_height = self._original.get_size()
+            half_width /= 2
+            half_height /= 2
+        return self._scale * (math.hypot(half_width, half_height) + 
+                              self._anchor_vec.length()) + 1
 
     # Helper method that determines the image's mask if it is dirty
     def _clean_mask (self, screen=None):
@@ -1140,10 +1170,17 @@ class Sprite (pygame.sprite.Sprite):
 
         # If a custom update function has been applied, call it
         if self._on_update_func is not None:
-            pgputils.call_with_args(self._on_update_func, sprite=self)
-
-        # Update the sprite's .image and .rect attributes needed for drawing
-        self._clean_image(screen)
+            pgputils.call_with_args(self._on_update_func, sprite=self, 
+                                    dt=_game_loop._dt)
+
+        # Update the sprite's .image and .rect attributes needed for drawing.
+        # If the sprite is outside of the camera's view, skip this work.
+        if screen is not None and not screen.camera.can_see(self._pos, 
+                radius=self._bounding_radius()):
+            self._culled = True
+        else:
+            self._clean_image(screen)
+            self._culled = False
         self._dirty_visible = False
 
 
@@ -1196,11 +1233,15 @@ class Sprite (pygame.sprite.Sprite):
                 raise ValueError(f"Invalid collision method: {method}")
             method = pgputils.collision_functions[method]
 
+        active_screen = get_active_screen()
+        if active_screen is None:
+            raise RuntimeError("No screen is active!")
+
         # Create the other "sprite"
         if y is None:
             x, y = x
         other_sprite = pygame.sprite.Sprite()
-        pygame_x, pygame_y = to_pygame_coordinates(x, y)
+        pygame_x, pygame_y = active_screen.camera.to_pygame_coordinates(x, y)
         other_sprite.rect = pygame.Rect(pygame_x, pygame_y, 1, 1)
         other_sprite.radius = 0.5
         other_sprite.mask = pygame.mask.Mask((1, 1), True)
@@ -1284,6 +1325,8 @@ class Sprite (pygame.sprite.Sprite):
             return False
 
         active_screen = get_active_screen()
+        if active_screen is None:
+            raise RuntimeError("No screen is active!")
 
         # Get the collision detection function for the given method
         if isinstance(method, str):
@@ -1334,6 +1377,11 @@ class Sprite (pygame.sprite.Sprite):
 
         You can provide the following arguments for the function `func`:
          - `sprite` - will provide the sprite object being updated
+         - `dt` - will provide the time (in seconds) since the last update
+        
+        Use `dt` to keep movements at the same speed even when the frame 
+        rate changes (e.g. `sprite.move_forward(200 * dt)` moves 200 pixels
+        per second).
         '''
 
         self._on_update_func = func
@@ -1399,6 +1447,7 @@ class Sprite (pygame.sprite.Sprite):
             self._click_funcs[button - 1] = func
             self._click_methods[button - 1] = method
             self._click_bleeds[button - 1] = bool(bleeds)
+            self._update_mouse_handlers()
         else:
             raise ValueError("Invalid button!")
 
@@ -1430,6 +1479,7 @@ class Sprite (pygame.sprite.Sprite):
         # If a button is valid, add the function to the appropriate button
         if 1 <= button <= 5:
             self._release_funcs[button - 1] = func
+            self._update_mouse_handlers()
         else:
             raise ValueError("Invalid button!")
 
@@ -1445,6 +1495,8 @@ class Sprite (pygame.sprite.Sprite):
          - `pos` - will provide a tuple of the coordinates (x and y) of the mouse
          - `button` - will provide the name of the mouse button used
          - `sprite` - will provide the sprite object involved
+         - `path` - will provide a list of the positions that the mouse moved
+           through (see the `coalesce_mouse_motion` property of the game loop)
 
         You can specify which mouse button needs to be used for the click using
         the `button` parameter.  It's value needs to be one of "left", "center",
@@ -1461,10 +1513,19 @@ class Sprite (pygame.sprite.Sprite):
         # If a button is valid, add the function to the appropriate button
         if 1 <= button <= 5:
             self._drag_funcs[button - 1] = func
+            self._update_mouse_handlers()
         else:
             raise ValueError("Invalid button!")
 
 
+    # A hidden method that tells the game loop whether or not this sprite
+    # has any mouse handlers.  The game loop skips the mouse events if no
+    # sprites or screens need them.
+    def _update_mouse_handlers (self):
+        funcs = self._click_funcs + self._release_funcs + self._drag_funcs
+        _game_loop._set_mouse_sprite(self, any([f is not None for f in funcs]))
+
+
 # What is included when importing *
 __all__ = [
     "Sprite"
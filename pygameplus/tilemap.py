@@ -0,0 +1,507 @@
+# Copyright 2022 Casey Devet
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+################################################################################
+#                               GLOBAL VARIABLES
+################################################################################
+
+import array
+import math
+import pygame
+
+################################################################################
+#                                TILEMAP CLASS
+################################################################################
+
+class TileMap (object):
+    '''
+    A TileMap is a grid of tiles that is drawn on a screen as a single layer.
+
+    Building a level out of thousands of Sprites is slow because every sprite
+    is updated and drawn on every frame.  A TileMap stores which tile is in
+    each cell of the grid and draws the tiles in large chunks that are only
+    redrawn when one of their tiles changes.  Only the chunks that are
+    visible to the screen's camera are drawn.
+
+    TileMap objects store the following information:
+     - The pictures that can be used as tiles
+     - Which tile is in each cell of the grid
+     - The position of the top left corner of the map
+     - Which tiles are solid
+
+    Methods are provided for the following:
+     - Getting and changing the tile in a cell
+     - Finding the cell at a given position
+     - Detecting whether or not a sprite is touching a solid tile
+
+    A TileMap is not a sprite.  Add it to a screen with the screen's 
+    `add_tile_map()` method, which also takes the layer to draw it in.
+    '''
+
+    # The number of rendered chunks that are kept when they are not visible.
+    # The chunks that were used least recently are forgotten first.
+    _chunk_cache_size = 64
+
+    def __init__ (self, tiles, columns, rows, tile_size=None, chunk_size=16):
+        '''
+        Create a TileMap object.
+
+        The `tiles` are a list of pictures that can be placed in the cells.
+        Each picture can be the name of an image file or a pygame Surface.
+        A tile is referred to using its index in this list.
+
+        The map has the given number of `columns` and `rows`, which all start
+        empty.  An empty cell has the tile -1.
+
+        If the `tile_size` is not given, then the size of the first tile is
+        used.  Any tiles that are not this size will be scaled.
+
+        The map is drawn in square chunks with `chunk_size` tiles on each
+        side.
+        '''
+
+        # Ensure that the dimensions are positive integers
+        try:
+            self._columns = int(columns)
+            self._rows = int(rows)
+            self._chunk_size = int(chunk_size)
+        except:
+            raise ValueError("The dimensions must be integers!") from None
+        if self._columns <= 0 or self._rows <= 0 or self._chunk_size <= 0:
+            raise ValueError("The dimensions must be positive!")
+
+        # Load the tile pictures
+        self._tiles = []
+        for tile in tiles:
+            if not isinstance(tile, pygame.Surface):
+                tile = pygame.image.load(tile).convert_alpha()
+            self._tiles.append(tile)
+        if not self._tiles:
+            raise ValueError("At least one tile must be given!")
+
+        # Make all of the tiles the same size
+        if tile_size is None:
+            tile_size = self._tiles[0].get_size()
+        try:
+            self._tile_width, self._tile_height = [int(d) for d in tile_size]
+        except:
+            raise ValueError("The tile size must be a tuple of two integers!") from None
+        for i, tile in enumerate(self._tiles):
+            if tile.get_size() != (self._tile_width, self._tile_height):
+                self._tiles[i] = pygame.transform.scale(tile,
+                        (self._tile_width, self._tile_height))
+
+        # The tile in each cell, stored row by row in a compact array
+        self._cells = array.array("h", [-1]) * (self._columns * self._rows)
+
+        # Center the map at (0, 0) by default
+        self._pos = pygame.Vector2(- self._columns * self._tile_width / 2,
+                                   self._rows * self._tile_height / 2)
+
+        # Which tiles are solid
+        self._solid = set()
+
+        # Caches of the rendered chunks in the order that they were last
+        # used.  The scaled chunks are only used when the camera is zoomed.
+        self._chunks = {}
+        self._scaled_chunks = {}
+        self._scaled_zoom = None
+
+
+    ### Map properties
+
+    @property
+    def columns (self):
+        '''
+        The number of columns in the map.  (Read-only)
+        '''
+
+        return self._columns
+
+
+    @property
+    def rows (self):
+        '''
+        The number of rows in the map.  (Read-only)
+        '''
+
+        return self._rows
+
+
+    @property
+    def tile_size (self):
+        '''
+        The width and height of each tile.  (Read-only)
+        '''
+
+        return self._tile_width, self._tile_height
+
+
+    @property
+    def size (self):
+        '''
+        The width and height of the entire map.  (Read-only)
+        '''
+
+        return self._columns * self._tile_width, self._rows * self._tile_height
+
+
+    @property
+    def position (self):
+        '''
+        The position of the top left corner of the map.
+
+        By default, the map is centered at (0, 0).
+        '''
+
+        return tuple(self._pos)
+
+    @position.setter
+    def position (self, new_position):
+
+        try:
+            self._pos = pygame.Vector2(new_position)
+        except:
+            raise ValueError("Invalid position!") from None
+
+
+    @property
+    def x (self):
+        '''
+        The x-coordinate of the top left corner of the map.
+        '''
+
+        return self._pos.x
+
+    @x.setter
+    def x (self, new_x):
+
+        try:
+            self.position = new_x, self._pos.y
+        except:
+            raise ValueError("Invalid x-coordinate!") from None
+
+
+    @property
+    def y (self):
+        '''
+        The y-coordinate of the top left corner of the map.
+        '''
+
+        return self._pos.y
+
+    @y.setter
+    def y (self, new_y):
+
+        try:
+            self.position = self._pos.x, new_y
+        except:
+            raise ValueError("Invalid y-coordinate!") from None
+
+
+    @property
+    def solid_tiles (self):
+        '''
+        The set of tiles that are solid.
+
+        Solid tiles are used by `is_solid_at()` and `is_touching()` to
+        detect collisions.
+        '''
+
+        return set(self._solid)
+
+    @solid_tiles.setter
+    def solid_tiles (self, new_tiles):
+
+        try:
+            self._solid = set([int(t) for t in new_tiles])
+        except:
+            raise ValueError("The solid tiles must be a collection of integers!") from None
+
+
+    ### Methods to get and change tiles
+
+    # A hidden method that checks a cell and returns its index in the array.
+    def _cell_index (self, column, row):
+        if not (0 <= column < self._columns and 0 <= row < self._rows):
+            raise ValueError(f"Invalid cell: ({column}, {row})")
+        return row * self._columns + column
+
+
+    # A hidden method that marks the chunk containing a cell to be redrawn.
+    def _dirty_chunk (self, column, row):
+        chunk = column // self._chunk_size, row // self._chunk_size
+        self._chunks.pop(chunk, None)
+        self._scaled_chunks.pop(chunk, None)
+
+
+    def get_tile (self, column, row):
+        '''
+        Return the tile in the given cell.
+
+        The top left cell is in column 0 and row 0.  An empty cell has
+        the tile -1.
+        '''
+
+        return self._cells[self._cell_index(column, row)]
+
+
+    def set_tile (self, column, row, tile):
+        '''
+        Change the tile in the given cell.
+
+        The top left cell is in column 0 and row 0.  Use -1 to make the
+        cell empty.
+
+        Only the chunk that contains the cell will be redrawn.
+        '''
+
+        # Ensure that the tile is valid
+        try:
+            tile = int(tile)
+        except:
+            raise ValueError("The tile must be an integer!") from None
+        if not -1 <= tile < len(self._tiles):
+            raise ValueError(f"Invalid tile: {tile}")
+
+        index = self._cell_index(column, row)
+        if self._cells[index] != tile:
+            self._cells[index] = tile
+            self._dirty_chunk(column, row)
+
+
+    def __getitem__ (self, cell):
+        return self.get_tile(*cell)
+
+    def __setitem__ (self, cell, tile):
+        self.set_tile(*cell, tile)
+
+
+    def fill (self, tile):
+        '''
+        Put the given tile in every cell of the map.
+        '''
+
+        self.load([[tile] * self._columns for _ in range(self._rows)])
+
+
+    def load (self, data):
+        '''
+        Change all of the tiles in the map.
+
+        The `data` must be a list of rows, where each row is a list of the
+        tiles in that row (e.g. `[[0, 0, 1], [1, 1, 1]]`).  Any cells that
+        are not given are made empty.
+        '''
+
+        cells = array.array("h", [-1]) * (self._columns * self._rows)
+        try:
+            for row, tiles in enumerate(data):
+                for column, tile in enumerate(tiles):
+                    tile = int(tile)
+                    if not -1 <= tile < len(self._tiles):
+                        raise ValueError()
+                    cells[row * self._columns + column] = tile
+        except:
+            raise ValueError("Invalid tile data!") from None
+
+        # Replace the tiles and redraw all chunks
+        self._cells = cells
+        self._chunks.clear()
+        self._scaled_chunks.clear()
+
+
+    ### Methods to find cells
+
+    def cell_at (self, x, y=None):
+        '''
+        Return the column and row of the cell at the given position.
+
+        This will return `None` if the position is not on the map.
+        '''
+
+        # If only one argument is given, expand it into x and y
+        if y is None:
+            x, y = x
+
+        column = math.floor((x - self._pos.x) / self._tile_width)
+        row = math.floor((self._pos.y - y) / self._tile_height)
+        if 0 <= column < self._columns and 0 <= row < self._rows:
+            return column, row
+        return None
+
+
+    def tile_at (self, x, y=None):
+        '''
+        Return the tile at the given position.
+
+        This will return -1 if the position is not on the map.
+        '''
+
+        cell = self.cell_at(x, y)
+        if cell is None:
+            return -1
+        return self._cells[cell[1] * self._columns + cell[0]]
+
+
+    def get_cell_center (self, column, row):
+        '''
+        Return the coordinates of the center of the given cell.
+        '''
+
+        self._cell_index(column, row)
+        return (self._pos.x + (column + 0.5) * self._tile_width,
+                self._pos.y - (row + 0.5) * self._tile_height)
+
+
+    ### Collision Methods
+
+    def is_solid_at (self, x, y=None):
+        '''
+        Return whether or not there is a solid tile at the given position.
+        '''
+
+        return self.tile_at(x, y) in self._solid
+
+
+    def get_cells_in (self, left, bottom, right, top):
+        '''
+        Return a list of the cells (as column and row pairs) that overlap the
+        rectangle with the given edges.
+
+        Only the cells that overlap the rectangle are checked, so this is
+        fast even for very large maps.
+        '''
+
+        first_column = max(0, math.floor((left - self._pos.x) / self._tile_width))
+        last_column = min(self._columns - 1,
+                          math.ceil((right - self._pos.x) / self._tile_width) - 1)
+        first_row = max(0, math.floor((self._pos.y - top) / self._tile_height))
+        last_row = min(self._rows - 1,
+                       math.ceil((self._pos.y - bottom) / self._tile_height) - 1)
+        return [(column, row) for row in range(first_row, last_row + 1)
+                for column in range(first_column, last_column + 1)]
+
+
+    def get_touching (self, sprite):
+        '''
+        Return a list of the cells (as column and row pairs) with solid tiles
+        that the sprite's image is touching.
+        '''
+
+        cells = self.get_cells_in(sprite.left_edge, sprite.bottom_edge,
+                                  sprite.right_edge, sprite.top_edge)
+        return [(column, row) for column, row in cells
+                if self._cells[row * self._columns + column] in self._solid]
+
+
+    def is_touching (self, sprite):
+        '''
+        Return whether or not the sprite's image is touching any solid tiles.
+        '''
+
+        return len(self.get_touching(sprite)) > 0
+
+
+    ### Drawing Methods
+
+    # A hidden method that draws the tiles of a chunk on a new surface.
+    def _render_chunk (self, chunk_x, chunk_y):
+        first_column = chunk_x * self._chunk_size
+        first_row = chunk_y * self._chunk_size
+        last_column = min(first_column + self._chunk_size, self._columns)
+        last_row = min(first_row + self._chunk_size, self._rows)
+        surface = pygame.Surface(((last_column - first_column) * self._tile_width,
+                                  (last_row - first_row) * self._tile_height),
+                                 pygame.SRCALPHA)
+        blits = []
+        for row in range(first_row, last_row):
+            start = row * self._columns
+            y = (row - first_row) * self._tile_height
+            for column in range(first_column, last_column):
+                tile = self._cells[start + column]
+                if tile >= 0:
+                    x = (column - first_column) * self._tile_width
+                    blits.append((self._tiles[tile], (x, y)))
+        surface.blits(blits, False)
+        return surface
+
+
+    # A hidden method that returns the blits needed to draw the chunks that
+    # are visible on the given screen.  This is called by Screen.draw().
+    def _visible_blits (self, screen):
+        camera = screen.camera
+        zoom = camera.zoom
+
+        # Forget the scaled chunks if the zoom has changed
+        if zoom != self._scaled_zoom:
+            self._scaled_chunks.clear()
+            self._scaled_zoom = zoom
+
+        # Find the part of the map that is in view
+        chunk_width = self._chunk_size * self._tile_width
+        chunk_height = self._chunk_size * self._tile_height
+        left = camera.x - screen.width / 2 / zoom - self._pos.x
+        right = camera.x + screen.width / 2 / zoom - self._pos.x
+        top = self._pos.y - camera.y - screen.height / 2 / zoom
+        bottom = self._pos.y - camera.y + screen.height / 2 / zoom
+        first_x = max(0, math.floor(left / chunk_width))
+        last_x = min(math.ceil(self._columns / self._chunk_size),
+                     math.ceil(right / chunk_width))
+        first_y = max(0, math.floor(top / chunk_height))
+        last_y = min(math.ceil(self._rows / self._chunk_size),
+                     math.ceil(bottom / chunk_height))
+
+        # Draw any visible chunks, rendering them if necessary
+        blits = []
+        for chunk_y in range(first_y, last_y):
+            for chunk_x in range(first_x, last_x):
+                chunk = chunk_x, chunk_y
+                image = self._chunks.pop(chunk, None)
+                if image is None:
+                    image = self._render_chunk(chunk_x, chunk_y)
+                self._chunks[chunk] = image
+                if zoom != 1:
+                    scaled = self._scaled_chunks.pop(chunk, None)
+                    if scaled is None:
+                        size = (math.ceil(image.get_width() * zoom),
+                                math.ceil(image.get_height() * zoom))
+                        scaled = pygame.transform.scale(image, size)
+                    self._scaled_chunks[chunk] = scaled
+                    image = scaled
+                dest = camera.to_pygame_coordinates(
+                        self._pos.x + chunk_x * chunk_width,
+                        self._pos.y - chunk_y * chunk_height)
+                blits.append((image, (round(dest.x), round(dest.y))))
+
+        # Forget the chunks that haven't been visible for the longest time.
+        # The visible chunks were just used, so they are never forgotten.
+        limit = max(TileMap._chunk_cache_size, len(blits))
+        for cache in (self._chunks, self._scaled_chunks):
+            while len(cache) > limit:
+                cache.pop(next(iter(cache)))
+
+        return blits
+
+
+# What is included when importing *
+__all__ = [
+    "TileMap"
+]
@@ -0,0 +1,215 @@
+# Copyright 2022 Casey Devet
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+################################################################################
+#                               GLOBAL VARIABLES
+################################################################################
+
+import heapq
+import itertools
+
+import pygame
+
+from . import pgputils
+
+# The IDs given to timers.  They are shared by all of the timer queues so
+# that a timer ID is never used twice.
+_timer_ids = itertools.count(1)
+
+################################################################################
+#                              TIMER QUEUE CLASS
+################################################################################
+
+class TimerQueue (object):
+    '''
+    A TimerQueue keeps track of functions that should be called after some
+    amount of time.
+
+    The timers are kept in a heap sorted by the time that they go off, so
+    finding the timers that are done only needs to look at the front of the
+    heap.  When a timer is cancelled, it is only forgotten and left in the
+    heap until it reaches the front.
+
+    A repeating timer that falls behind goes off again in the same run to 
+    catch up, but only up to `_max_catch_up` times.  After that, it starts 
+    again from the current time so that a long pause doesn't cause a flood 
+    of calls.
+
+    A TimerQueue can be paused.  While it is paused, its timers don't run 
+    and the time that passes doesn't count towards their delays.
+
+    You will not usually need to use a TimerQueue directly.  Use the
+    `on_timer()` method of a Screen or the game loop instead.
+    '''
+
+    # The most times that a repeating timer goes off in one run
+    _max_catch_up = 10
+
+    def __init__ (self):
+        '''
+        Create an empty TimerQueue.
+        '''
+
+        # The heap holds tuples of (time, ID) for when each timer goes off
+        # and the dictionary maps the IDs of the timers that haven't been
+        # cancelled to their function, delay and whether they repeat.
+        self._heap = []
+        self._timers = {}
+
+        # The time that the queue was paused at, or None if it is running
+        self._paused_at = None
+
+
+    def __len__ (self):
+
+        return len(self._timers)
+
+
+    def __contains__ (self, timer_id):
+
+        return timer_id in self._timers
+
+
+    def add (self, func, delay, repeat=False):
+        '''
+        Add a timer that calls `func` after `delay` milliseconds.
+
+        If `repeat` is `True`, the timer restarts every time that it goes
+        off.  Returns the ID of the timer.
+        '''
+
+        # A timer added while paused starts counting when the queue resumes
+        start = self._paused_at
+        if start is None:
+            start = pygame.time.get_ticks()
+
+        timer_id = next(_timer_ids)
+        self._timers[timer_id] = (func, delay, repeat)
+        heapq.heappush(self._heap, (start + delay, timer_id))
+        return timer_id
+
+
+    def cancel (self, timer_id):
+        '''
+        Cancel the timer with the given ID.
+
+        Returns `True` if the timer was cancelled or `False` if there is no
+        timer with that ID.
+        '''
+
+        if self._timers.pop(timer_id, None) is None:
+            return False
+
+        # If most of the heap is cancelled timers, build it again
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._timers):
+            self._heap = [entry for entry in self._heap if entry[1] in self._timers]
+            heapq.heapify(self._heap)
+        return True
+
+
+    def clear (self):
+        '''
+        Cancel all of the timers.
+        '''
+
+        self._heap = []
+        self._timers = {}
+
+
+    def pause (self, now=None):
+        '''
+        Stop the timers from counting down until `resume()` is called.
+
+        The `now` is the current time in milliseconds.  If it isn't given,
+        `pygame.time.get_ticks()` is used.
+        '''
+
+        if self._paused_at is None:
+            self._paused_at = pygame.time.get_ticks() if now is None else now
+
+
+    def resume (self, now=None):
+        '''
+        Start the timers counting down again after `pause()` was called.
+
+        The time that passed while the queue was paused is added to every
+        timer, so none of them go off just because the queue was paused.
+        '''
+
+        if self._paused_at is None:
+            return
+        if now is None:
+            now = pygame.time.get_ticks()
+
+        # Moving every timer by the same amount keeps the heap in order
+        shift = now - self._paused_at
+        self._heap = [(due + shift, timer_id) for due, timer_id in self._heap]
+        self._paused_at = None
+
+
+    def run (self, now=None):
+        '''
+        Call the functions of all of the timers that have gone off.
+
+        The `now` is the current time in milliseconds.  If it isn't given,
+        `pygame.time.get_ticks()` is used.  Nothing happens while the queue
+        is paused.
+        '''
+
+        if self._paused_at is not None:
+            return
+        if now is None:
+            now = pygame.time.get_ticks()
+
+        # The number of times that each repeating timer has gone off
+        fired = {}
+
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, timer_id = heapq.heappop(heap)
+
+            # Skip the timers that were cancelled
+            timer = self._timers.get(timer_id)
+            if timer is None:
+                continue
+            func, delay, repeat = timer
+
+            # Restart a repeating timer.  If it is still behind, it goes off
+            # again in this run unless it has already caught up too many 
+            # times, in which case it starts again from now.
+            if repeat:
+                due += delay
+                count = fired.get(timer_id, 0) + 1
+                fired[timer_id] = count
+                if due <= now and count >= TimerQueue._max_catch_up:
+                    due = now + delay
+                heapq.heappush(heap, (due, timer_id))
+            else:
+                self._timers.pop(timer_id)
+
+            pgputils.call_with_args(func)
+
+            # The function might have cleared the timers
+            heap = self._heap
+
+
+__all__ = [
+    "TimerQueue"
+]
@@ -22,6 +22,7 @@
 #                               GLOBAL VARIABLES
 ################################################################################
 
+import collections
 import math
 import pygame
 
@@ -45,6 +46,10 @@ class Turtle (Painter):
 
     _game_loop = get_game_loop()
 
+    # The attributes that make the screen redraw when they are set to True
+    _redraw_flags = frozenset(['_dirty_rotate', '_dirty_scale', '_dirty_flip', 
+                               '_dirty_canvas', '_dirty_visible'])
+
     def __init__ (self):
         '''
         Create a Turtle object.
@@ -52,14 +57,23 @@ class Turtle (Painter):
 
         # The attributes used to animate the turtle
         self._speed = 120
-        self._step_size = 120 / self._game_loop._frame_rate
         self._animate = True
 
+        # The animate setting to go back to when fastest mode is turned off
+        self._animate_before_fastest = True
+
         # Attributes that allow the speed to be maintained over multiple changes
-        # to position
-        self._animate_queue = []
-        self._pixels_remaining = 0
-        self._terminate_game_loop = False
+        # to position.  The queue holds the motions that haven't been 
+        # animated yet and the progress is how far along the first one is.
+        # The time remaining is the part of the last update that wasn't
+        # needed to finish the queue, which can only be used until the next
+        # update.
+        self._animate_queue = collections.deque()
+        self._segment_progress = 0
+        self._time_remaining = 0
+        self._time_remaining_update = None
+        self._queue_pos = None
+        self._queue_dir = None
 
         Painter.__init__(self, "turtle")
 
@@ -70,13 +84,16 @@ class Turtle (Painter):
 
 
     def __setattr__ (self, name, value):
-        if name in ['_dirty_rotate', '_dirty_scale', '_dirty_flip', '_dirty_canvas', '_dirty_visible'] and value is True and not self._game_loop.running:
+        super().__setattr__(name, value)
+
+        # When the turtle changes and the game loop isn't running, ask the
+        # screen to redraw.  The screen's tracer decides how often it does.
+        if (value is True and name in Turtle._redraw_flags and 
+                not self._buffer_drawing and not self._game_loop.running):
             active_screen = get_active_screen()
             if active_screen is not None:
                 if name == '_dirty_visible' or self in active_screen:
-                    active_screen.draw()
-                    pygame.display.flip()
-        super().__setattr__(name, value)
+                    active_screen._request_redraw()
 
 
     ### Animation properties
@@ -103,9 +120,7 @@ class Turtle (Painter):
         if new_speed <= 0:
             raise ValueError("The speed must be positive!")
 
-        # Set the speed and the step size
         self._speed = new_speed
-        self._step_size = new_speed / self._game_loop._frame_rate
 
 
     @property
@@ -124,6 +139,42 @@ class Turtle (Painter):
         self._animate = bool(is_animated)
 
 
+    @property
+    def fastest (self):
+        '''
+        Whether or not the turtle draws as fast as possible.
+
+        In fastest mode, the turtle's movements are not animated, lines are
+        collected and drawn all at once, and the screen isn't redrawn after
+        each change.  Nothing is shown until the screen is drawn, so call
+        the screen's `redraw()` method when the drawing is done.
+
+        Turning fastest mode off sets `animate` back to what it was before
+        fastest mode was turned on.
+        '''
+
+        return self._buffer_drawing
+
+    @fastest.setter
+    def fastest (self, is_fastest):
+
+        is_fastest = bool(is_fastest)
+        if is_fastest == self._buffer_drawing:
+            return
+        if is_fastest:
+            self._animate_before_fastest = self._animate
+            self._animate = False
+        else:
+            self._flush_paths()
+            self._animate = self._animate_before_fastest
+        self._buffer_drawing = is_fastest
+
+
+    # Paths can only be drawn all at once if the moves aren't animated.
+    def _batches_paths (self):
+        return not self._animate
+
+
     def turn_to (self, direction, reverse=False):
         '''
         Turn the sprite to the point at the given `direction`.
@@ -142,46 +193,66 @@ class Turtle (Painter):
             super().turn_to(direction, reverse=reverse)
             return
 
-        # Calculate the arc length of the rotation of the turtle's head
-        current = self._dir
+        # Find the angle to turn from the end of any queued motions.  The 
+        # turtle's head moves along an arc at the turtle's speed.
+        _, current = self._queue_end()
         end = (direction + 180) % 360 if reverse else direction
         angle_change = (end - current + 180) % 360 - 180
         arc_length = self._scale * math.pi * abs(angle_change) / 15
-        pixel_angle = 15 / math.pi / self._scale
-        if angle_change < 0:
-            pixel_angle = -pixel_angle
-
-        # If we still have sufficient pixels in the frame, just move
-        if arc_length <= self._pixels_remaining:
-            Painter.direction.fset(self, end)
-            self._pixels_remaining -= arc_length
-            return
 
-        # If there are pixels remaining in the frame, use them up
-        elif self._pixels_remaining > 0:
-            current = current + self._pixels_remaining * pixel_angle
-            Painter.direction.fset(self, current)
-            arc_length -= self._pixels_remaining
-            self._pixels_remaining = 0
-
-        # Find all of the remaining steps that need to be queued
-        while arc_length > 0:
-            # If there is only a bit left, queue it with pixels remaining
-            if arc_length < self._step_size:
-                self._animate_queue.append((self._pos, end, self._step_size - arc_length))
-                arc_length = 0
-
-            # Otherwise, queue a whole step
-            else:
-                current = current + self._step_size * pixel_angle
-                self._animate_queue.append((self._pos, current, 0))
-                arc_length -= self._step_size
+        self._queue_motion("turn", current, current + angle_change, arc_length)
+
+
+    # The relative turns and moves start from the end of any queued motions
+
+    def turn_left (self, angle):
+        '''
+        Turn the sprite left (counterclockwise) by the given `angle`.
+        '''
+
+        self.turn_to(self._queue_end()[1] + angle)
+
+
+    def turn_right (self, angle):
+        '''
+        Turn the sprite right (clockwise) by the given `angle`.
+        '''
 
-        # If the game loop is not running, start it up to animate
-        # this move
-        if not self._game_loop.running:
-            self._terminate_game_loop = True
-            self._game_loop.start()
+        self.turn_to(self._queue_end()[1] - angle)
+
+
+    def turn_toward (self, x, y=None, reverse=False):
+        '''
+        Turn the sprite towards the given coordinates.
+        '''
+
+        # Get the distance and direction
+        delta = pygame.Vector2(x, y) - self._queue_end()[0]
+        distance, direction = delta.as_polar()
+
+        # Don't turn if given current location
+        if distance > 0:
+            self.turn_to(direction, reverse=reverse)
+
+
+    def move_forward (self, distance):
+        '''
+        Move the sprite by the given `distance` in the direction it is currently
+        pointing.
+        '''
+
+        position, direction = self._queue_end()
+        self.go_to(position + pygame.Vector2(distance, 0).rotate(direction))
+
+
+    def move_backward (self, distance):
+        '''
+        Move the sprite by the given `distance` in the opposite of the
+        direction it is currently pointing.
+        '''
+
+        position, direction = self._queue_end()
+        self.go_to(position + pygame.Vector2(-distance, 0).rotate(direction))
 
 
     def go_to (self, x, y=None, turn=True, reverse=False):
@@ -200,84 +271,89 @@ class Turtle (Painter):
             return
 
         # Create vectors for the start and end positions
-        current = pygame.Vector2(self._pos)
+        current, _ = self._queue_end()
         end = pygame.Vector2(x, y)
 
-        # Calculate the distance and direction to the point
-        delta = end - current
-        distance, direction = delta.as_polar()
-        delta_normal = delta.normalize()
-
         # If turning to go to the point, animate the turn as well
-        if turn:
+        distance, direction = (end - current).as_polar()
+        if turn and distance > 0:
             self.turn_to(direction, reverse=reverse)
-            if reverse:
-                direction = (direction + 180) % 360
-        else:
-            direction = self._dir
 
-        # If we still have sufficient pixels in the frame, just move
-        if distance <= self._pixels_remaining:
-            Painter.position.fset(self, end)
-            self._pixels_remaining -= distance
-            return
+        self._queue_motion("move", current, end, distance)
 
-        # If there are pixels remaining in the frame, use them up
-        elif self._pixels_remaining > 0:
-            current = current + self._pixels_remaining * delta_normal
-            Painter.position.fset(self, current)
-            distance -= self._pixels_remaining
-            self._pixels_remaining = 0
-
-        # Find all of the remaining steps that need to be queued
-        while distance > 0:
-            # If there is only a bit left, queue it with pixels remaining
-            if distance < self._step_size:
-                self._animate_queue.append((end, direction, self._step_size - distance))
-                distance = 0
-
-            # Otherwise, queue a whole step
-            else:
-                current = current + self._step_size * delta_normal
-                self._animate_queue.append((current, direction, 0))
-                distance -= self._step_size
 
-        # If the game loop is not running, start it up to animate
-        # this move
-        if not self._game_loop.running:
-            self._terminate_game_loop = True
-            self._game_loop.start()
+    # A hidden method that returns the position and direction that the turtle
+    # will have after all of the queued motions.
+    def _queue_end (self):
+        if self._animate_queue:
+            return self._queue_pos, self._queue_dir
+        return pygame.Vector2(self._pos), self._dir
 
 
-    def update (self, screen=None):
-        '''
-        Update the sprite in preparation to draw the next frame.
+    # A hidden method that adds a motion to the animation queue.  A motion
+    # is a "move" between two positions or a "turn" between two directions
+    # along with its length (in pixels) and the speed (in pixels per second).
+    def _queue_motion (self, kind, start, end, length):
+        if length <= 0:
+            return
+
+        self._queue_pos, self._queue_dir = self._queue_end()
+        if kind == "move":
+            self._queue_pos = end
+        else:
+            self._queue_dir = end % 360
+        self._animate_queue.append((kind, start, end, length, self._speed))
+
+        # If there is still time left in the last update, use it up.  Once
+        # another update has started, that time is gone.
+        if self._time_remaining_update != self._game_loop._update_count:
+            self._time_remaining = 0
+        if self._time_remaining > 0:
+            self._time_remaining = self._advance(self._time_remaining)
+
+        # Have the game loop's scheduler animate the queue.  If the game
+        # loop isn't running, this will start it until the motions are done.
+        if self._animate_queue:
+            self._game_loop._add_animation(self)
+
+
+    # A hidden method that animates the queued motions for the given number
+    # of seconds.  Returns the part of the time that wasn't needed.
+    def _advance (self, time):
+        queue = self._animate_queue
+        while queue and time > 0:
+            kind, start, end, length, speed = queue[0]
+
+            # Find how far along the motion the turtle gets
+            remaining = length - self._segment_progress
+            available = time * speed
+            if available < remaining:
+                self._segment_progress += available
+                fraction = self._segment_progress / length
+                time = 0
+            else:
+                queue.popleft()
+                self._segment_progress = 0
+                fraction = 1
+                time -= remaining / speed
+
+            # Move or turn the turtle
+            if kind == "move":
+                Painter.position.fset(self, start.lerp(end, fraction))
+            else:
+                Painter.direction.fset(self, start + (end - start) * fraction)
+
+        return time
 
-        This method should generally not be called explicitly, but will be called
-        by the event loop if the sprite is on the active screen.
-        '''
 
-        # At the beginning of the frame, we need to leave room for
-        # possible small movements that don't require another frame
-        self._pixels_remaining = self._step_size
-
-        # If there are animations queue, complete one frame of them
-        while self._animate_queue:
-            new_pos, new_dir, pixels_left = self._animate_queue.pop(0)
-            Painter.direction.fset(self, new_dir)
-            Painter.position.fset(self, new_pos)
-            self._pixels_remaining = pixels_left
-            if not pixels_left:
-                break
-
-        # If there are no more animations and the game loop is only
-        # running for this turtle, kill it.
-        if self._terminate_game_loop and not self._animate_queue:
-            self._terminate_game_loop = False
-            self._game_loop.stop()
-
-        # Call parent update method
-        super().update(screen)
+    # A hidden method that is called by the game loop's scheduler to
+    # animate `dt` seconds of the queued motions.  If they finish early, the
+    # rest of the time can be used by the next motions.  Returns whether or
+    # not there are more motions to animate.
+    def _advance_animation (self, dt):
+        self._time_remaining = self._advance(dt)
+        self._time_remaining_update = self._game_loop._update_count
+        return bool(self._animate_queue)
 
 
 # What is included when importing *